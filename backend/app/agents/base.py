@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Iterable, Mapping
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Mapping, Optional, Union
+
+from ..core.deadline import Deadline
+from ..services.answer_cache import CacheLookup, SemanticAnswerCache
+from ..services.llm_service import LLMService
 
 
 @dataclass
@@ -15,8 +19,19 @@ class AgentResponse:
     context: Dict[str, object]
 
 
+AgentStreamItem = Union[str, AgentResponse]
+
+
 class BaseAgent(ABC):
-    """Abstract conversation agent interface."""
+    """Abstract conversation agent interface.
+
+    Agents that answer through an LLM set ``_llm_service`` (and optionally
+    ``_answer_cache``) and generate with ``_answer`` or ``_stream_answer``,
+    passing the cache scope of the turn or ``None`` to skip the cache.
+    """
+
+    _llm_service: LLMService
+    _answer_cache: Optional[SemanticAnswerCache] = None
 
     @abstractmethod
     async def handle_message(
@@ -24,6 +39,85 @@ class BaseAgent(ABC):
         message: str,
         context: Dict[str, object],
         attachments: Iterable[Mapping[str, object]],
+        deadline: Optional[Deadline] = None,
     ) -> AgentResponse:
         """Process the user message and return the model response and new context."""
 
+    async def stream_message(
+        self,
+        message: str,
+        context: Dict[str, object],
+        attachments: Iterable[Mapping[str, object]],
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[AgentStreamItem]:
+        """Yield response tokens followed by the final ``AgentResponse``.
+
+        Agents that cannot stream fall back to a single chunk holding the whole
+        message.
+        """
+
+        response = await self.handle_message(message, context, attachments, deadline)
+        yield response.message
+        yield response
+
+    async def _answer(
+        self,
+        message: str,
+        context: Dict[str, object],
+        prompt: str,
+        cache_scope: Optional[str],
+        deadline: Optional[Deadline],
+    ) -> str:
+        """Return a cached answer for ``message`` or generate one from ``prompt``."""
+
+        lookup = await self._lookup_answer(message, context, cache_scope, deadline)
+        if lookup.answer is not None:
+            return lookup.answer
+        response_text = await self._llm_service.complete(prompt=prompt, deadline=deadline)
+        self._remember_answer(lookup, response_text)
+        return response_text
+
+    async def _stream_answer(
+        self,
+        message: str,
+        context: Dict[str, object],
+        prompt: str,
+        cache_scope: Optional[str],
+        deadline: Optional[Deadline],
+        finish: Callable[[str], AgentResponse],
+    ) -> AsyncIterator[AgentStreamItem]:
+        """Streaming ``_answer``; ``finish`` builds the closing response."""
+
+        lookup = await self._lookup_answer(message, context, cache_scope, deadline)
+        if lookup.answer is not None:
+            response_text = lookup.answer
+            yield response_text
+        else:
+            chunks: List[str] = []
+            async for token in self._llm_service.stream(prompt=prompt, deadline=deadline):
+                chunks.append(token)
+                yield token
+            response_text = "".join(chunks)
+            self._remember_answer(lookup, response_text)
+        yield finish(response_text)
+
+    async def _lookup_answer(
+        self,
+        message: str,
+        context: Dict[str, object],
+        cache_scope: Optional[str],
+        deadline: Optional[Deadline],
+    ) -> CacheLookup:
+        # Only opening questions are cached: follow-ups depend on history that
+        # the cache key cannot see.
+        if (
+            self._answer_cache is None
+            or cache_scope is None
+            or context.get("conversation_history")
+        ):
+            return CacheLookup()
+        return await self._answer_cache.lookup(cache_scope, message, deadline)
+
+    def _remember_answer(self, lookup: CacheLookup, response_text: str) -> None:
+        if self._answer_cache is not None:
+            self._answer_cache.store(lookup, response_text)
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Mapping
+import hashlib
+import json
+from functools import partial
+from typing import AsyncIterator, Dict, Iterable, List, Mapping, Optional, Tuple
 
-from .base import AgentResponse, BaseAgent
+from .base import AgentResponse, AgentStreamItem, BaseAgent
+from ..core.deadline import Deadline
+from ..services.answer_cache import SemanticAnswerCache
 from ..services.device_ops_service import DeviceOpsService
 from ..services.llm_service import LLMService
 from ..services.prompt_service import PromptService
@@ -18,18 +23,45 @@ class DeviceOpsAgent(BaseAgent):
         device_ops_service: DeviceOpsService,
         prompt_service: PromptService,
         llm_service: LLMService,
+        answer_cache: Optional[SemanticAnswerCache] = None,
     ) -> None:
         self._device_ops_service = device_ops_service
         self._prompt_service = prompt_service
         self._llm_service = llm_service
+        self._answer_cache = answer_cache
 
     async def handle_message(
         self,
         message: str,
         context: Dict[str, object],
         attachments: Iterable[Mapping[str, object]],
+        deadline: Optional[Deadline] = None,
     ) -> AgentResponse:
         _ = list(attachments)  # Attachments currently unused but force evaluation.
+        summarized, prompt = self._prepare_turn(message, context)
+        response_text = await self._answer(
+            message, context, prompt, self._cache_scope(context, summarized), deadline
+        )
+        return self._finish_turn(message, context, summarized, response_text)
+
+    async def stream_message(
+        self,
+        message: str,
+        context: Dict[str, object],
+        attachments: Iterable[Mapping[str, object]],
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[AgentStreamItem]:
+        _ = list(attachments)
+        summarized, prompt = self._prepare_turn(message, context)
+        finish = partial(self._finish_turn, message, context, summarized)
+        async for item in self._stream_answer(
+            message, context, prompt, self._cache_scope(context, summarized), deadline, finish
+        ):
+            yield item
+
+    def _prepare_turn(
+        self, message: str, context: Dict[str, object]
+    ) -> Tuple[Dict[str, str], str]:
         telemetry = context.get("telemetry", {})
         summarized = self._device_ops_service.summarize_telemetry(telemetry)
         history = self._extract_history(context)
@@ -38,9 +70,24 @@ class DeviceOpsAgent(BaseAgent):
             telemetry=summarized,
             history=history,
         )
+        return summarized, prompt
+
+    @staticmethod
+    def _cache_scope(context: Dict[str, object], summarized: Dict[str, str]) -> Optional[str]:
+        """Share answers only between questions about the same telemetry state."""
 
-        response_text = await self._llm_service.complete(prompt=prompt)
+        if not context.get("telemetry"):
+            return None
+        state = json.dumps(summarized, sort_keys=True, default=str)
+        return "device_ops:" + hashlib.sha256(state.encode("utf-8")).hexdigest()
 
+    def _finish_turn(
+        self,
+        message: str,
+        context: Dict[str, object],
+        summarized: Dict[str, str],
+        response_text: str,
+    ) -> AgentResponse:
         updated_context = self._build_context(
             context=context,
             user_message=message,
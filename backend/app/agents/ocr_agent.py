@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Mapping
+import hashlib
+from functools import partial
+from typing import AsyncIterator, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from fastapi.concurrency import run_in_threadpool
 
-from .base import AgentResponse, BaseAgent
+from .base import AgentResponse, AgentStreamItem, BaseAgent
+from ..core.deadline import Deadline
+from ..services.answer_cache import SemanticAnswerCache
 from ..services.llm_service import LLMService
-from ..services.ocr_service import OCRService
+from ..services.ocr_service import DocumentExtraction, OCRService
 from ..services.prompt_service import PromptService
 
 
@@ -20,21 +24,61 @@ class OCRConversationAgent(BaseAgent):
         ocr_service: OCRService,
         prompt_service: PromptService,
         llm_service: LLMService,
+        answer_cache: Optional[SemanticAnswerCache] = None,
     ) -> None:
         self._ocr_service = ocr_service
         self._prompt_service = prompt_service
         self._llm_service = llm_service
+        self._answer_cache = answer_cache
 
     async def handle_message(
         self,
         message: str,
         context: Dict[str, object],
         attachments: Iterable[Mapping[str, object]],
+        deadline: Optional[Deadline] = None,
     ) -> AgentResponse:
         attachment_payload = list(attachments)
-        ocr_results = await run_in_threadpool(
-            self._ocr_service.run_ocr, attachment_payload
+        documents, ocr_results, prompt = await self._prepare_turn(
+            message, context, attachment_payload, deadline
         )
+        response_text = await self._answer(
+            message, context, prompt, self._cache_scope(documents), deadline
+        )
+        return self._finish_turn(
+            message, context, attachment_payload, documents, ocr_results, response_text
+        )
+
+    async def stream_message(
+        self,
+        message: str,
+        context: Dict[str, object],
+        attachments: Iterable[Mapping[str, object]],
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[AgentStreamItem]:
+        attachment_payload = list(attachments)
+        documents, ocr_results, prompt = await self._prepare_turn(
+            message, context, attachment_payload, deadline
+        )
+        finish = partial(
+            self._finish_turn, message, context, attachment_payload, documents, ocr_results
+        )
+        async for item in self._stream_answer(
+            message, context, prompt, self._cache_scope(documents), deadline, finish
+        ):
+            yield item
+
+    async def _prepare_turn(
+        self,
+        message: str,
+        context: Dict[str, object],
+        attachment_payload: List[Mapping[str, object]],
+        deadline: Optional[Deadline],
+    ) -> Tuple[List[DocumentExtraction], List[str], str]:
+        documents = await run_in_threadpool(
+            self._ocr_service.extract_documents, attachment_payload, deadline
+        )
+        ocr_results = self._ocr_service.document_texts(documents, attachment_payload)
         combined_context = "\n".join(ocr_results)
         history = self._extract_history(context)
         prompt = self._prompt_service.build_ocr_prompt(
@@ -42,17 +86,39 @@ class OCRConversationAgent(BaseAgent):
             document_context=combined_context,
             history=history,
         )
+        return documents, ocr_results, prompt
 
-        response_text = await self._llm_service.complete(prompt=prompt)
+    @staticmethod
+    def _cache_scope(documents: List[DocumentExtraction]) -> Optional[str]:
+        """Scope answers to the exact attachment bytes of the turn."""
 
+        if not documents:
+            return None
+        digests = "\n".join(document.digest for document in documents)
+        return "ocr:" + hashlib.sha256(digests.encode("utf-8")).hexdigest()
+
+    def _finish_turn(
+        self,
+        message: str,
+        context: Dict[str, object],
+        attachment_payload: List[Mapping[str, object]],
+        documents: List[DocumentExtraction],
+        ocr_results: List[str],
+        response_text: str,
+    ) -> AgentResponse:
         updated_context = self._build_context(
             context=context,
             user_message=message,
             agent_message=response_text,
             attachments=[att.get("name", "") for att in attachment_payload],
         )
+        pages = [
+            {"document": document.name, "page": page.page_number, "method": page.method}
+            for document in documents
+            for page in document.pages
+        ]
         updated_context.setdefault("ocr_history", []).append(
-            {"query": message, "documents": ocr_results}
+            {"query": message, "documents": ocr_results, "pages": pages}
         )
 
         return AgentResponse(message=response_text, context=updated_context)
@@ -0,0 +1,64 @@
+"""Admin-only diagnostics routes, mounted when profiling is enabled."""
+
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+
+from ..core.config import settings
+from ..core.profiling import ProfileStore, is_admin, render_collapsed, sample_stacks
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    if not is_admin(x_admin_token, settings.admin_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin token required")
+
+
+profile_store = ProfileStore(max_profiles=settings.max_stored_profiles)
+
+WORKER_PID_HEADER = "X-Worker-Pid"
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def sample_profile(
+    response: Response,
+    seconds: float = Query(5.0, gt=0, le=60),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+) -> str:
+    """Sample every thread of this worker and return collapsed stacks.
+
+    Feed the output to ``flamegraph.pl`` or speedscope. Only the worker process
+    that handles the call is sampled; samples are not aggregated across
+    workers. ``X-Worker-Pid`` names the sampled process so calls that land on
+    different workers can be told apart.
+    """
+
+    counts = await run_in_threadpool(sample_stacks, seconds, interval_ms / 1000)
+    response.headers[WORKER_PID_HEADER] = str(os.getpid())
+    return render_collapsed(counts)
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(
+    profile_id: str,
+    format: str = Query("pstats", regex="^(pstats|text)$"),
+) -> Response:
+    """Fetch a per-request profile as a pstats dump or a text summary."""
+
+    if format == "text":
+        report = profile_store.render(profile_id)
+        if report is not None:
+            return PlainTextResponse(report)
+    else:
+        dump = profile_store.dump(profile_id)
+        if dump is not None:
+            return Response(
+                content=dump,
+                media_type="application/octet-stream",
+                headers={"Content-Disposition": f'attachment; filename="{profile_id}.pstats"'},
+            )
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Unknown profile id")
@@ -1,29 +1,274 @@
 """API routes for the AgenticAI backend."""
 
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, TypeVar, Union
 
-from ..schemas.chat import ChatRequest, ChatResponse
+import httpx
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from ..agents.base import AgentResponse
+from ..core.config import settings
+from ..core.deadline import Deadline, DeadlineExceeded
+from ..core.metrics import CLIENT_DISCONNECTS, DEADLINES_EXCEEDED, metrics
+from ..schemas.chat import (
+    Attachment,
+    AttachmentUploadResponse,
+    ChatRequest,
+    ChatResponse,
+)
 from ..services.agent_registry import AgentRegistry, get_agent_registry
+from ..services.attachment_store import (
+    AttachmentNotFoundError,
+    AttachmentStore,
+    get_attachment_store,
+)
+from ..services.llm_service import LLMServiceError
+from ..services.session_store import SessionStore, get_session_store
 
 router = APIRouter()
 
+T = TypeVar("T")
+
+# Status used by nginx for "client closed request"; nobody reads the body anyway.
+CLIENT_CLOSED_REQUEST = 499
+_DISCONNECT_POLL_SECONDS = 0.25
+
+
+class _ClientDisconnected(Exception):
+    """Raised internally when the HTTP client goes away mid-request."""
+
 
 @router.post("/chat", response_model=ChatResponse)
 async def chat(
     request: ChatRequest,
+    http_request: Request,
+    request_timeout: Optional[float] = Header(None, alias="X-Request-Timeout", gt=0),
     registry: AgentRegistry = Depends(get_agent_registry),
-) -> ChatResponse:
+    sessions: SessionStore = Depends(get_session_store),
+    store: AttachmentStore = Depends(get_attachment_store),
+) -> Union[ChatResponse, Response]:
     """Dispatch chat requests to the appropriate agent."""
 
     agent = registry.get_agent(request.agent_id)
-    agent_response = await agent.handle_message(
-        message=request.message,
-        context=request.context or {},
-        attachments=[attachment.dict() for attachment in request.attachments or []],
+    deadline = _request_deadline(request, request_timeout)
+    try:
+        agent_response = await _until_disconnected(
+            http_request,
+            deadline,
+            agent.handle_message(
+                message=request.message,
+                context=_load_context(request, sessions),
+                attachments=resolve_attachments(request.attachments, store),
+                deadline=deadline,
+            ),
+        )
+    except _ClientDisconnected:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    except DeadlineExceeded as exc:
+        metrics.increment(DEADLINES_EXCEEDED)
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=str(exc)
+        ) from exc
+
+    return _finish_chat(request, agent_response, sessions)
+
+
+@router.post("/chat/stream")
+async def chat_stream(
+    request: ChatRequest,
+    request_timeout: Optional[float] = Header(None, alias="X-Request-Timeout", gt=0),
+    registry: AgentRegistry = Depends(get_agent_registry),
+    sessions: SessionStore = Depends(get_session_store),
+    store: AttachmentStore = Depends(get_attachment_store),
+) -> StreamingResponse:
+    """Stream the agent response as newline-delimited JSON events.
+
+    Each line is either ``{"type": "token", "content": ...}`` or the closing
+    ``{"type": "done", ...}`` event carrying the ``ChatResponse`` fields. A
+    ``{"type": "error", ...}`` event replaces it when the deadline expires or the
+    LLM provider fails mid-stream.
+    """
+
+    agent = registry.get_agent(request.agent_id)
+    deadline = _request_deadline(request, request_timeout)
+    context = _load_context(request, sessions)
+    attachments = resolve_attachments(request.attachments, store)
+
+    async def events() -> AsyncIterator[str]:
+        completed = False
+        try:
+            async for item in agent.stream_message(
+                message=request.message,
+                context=context,
+                attachments=attachments,
+                deadline=deadline,
+            ):
+                if isinstance(item, AgentResponse):
+                    done = _finish_chat(request, item, sessions)
+                    yield _ndjson({"type": "done", **done.dict()})
+                else:
+                    yield _ndjson({"type": "token", "content": item})
+            completed = True
+        except DeadlineExceeded as exc:
+            metrics.increment(DEADLINES_EXCEEDED)
+            yield _ndjson(
+                {
+                    "type": "error",
+                    "status_code": status.HTTP_504_GATEWAY_TIMEOUT,
+                    "detail": str(exc),
+                }
+            )
+        except (LLMServiceError, httpx.HTTPError) as exc:
+            yield _ndjson(
+                {
+                    "type": "error",
+                    "status_code": status.HTTP_502_BAD_GATEWAY,
+                    "detail": str(exc),
+                }
+            )
+        except (asyncio.CancelledError, GeneratorExit):
+            # Starlette cancels the body iterator once the client disconnects.
+            metrics.increment(CLIENT_DISCONNECTS)
+            raise
+        finally:
+            if not completed:
+                deadline.cancel()
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/attachments",
+    response_model=AttachmentUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload_attachment(
+    request: Request,
+    name: str,
+    content_type: Optional[str] = None,
+    store: AttachmentStore = Depends(get_attachment_store),
+) -> AttachmentUploadResponse:
+    """Store a raw request body so later chat turns can reference it by id."""
+
+    declared_length = request.headers.get("content-length", "")
+    if declared_length.isdigit() and int(declared_length) > settings.max_upload_bytes:
+        raise _upload_too_large()
+    # Count while streaming so chunked bodies without Content-Length are capped too.
+    chunks: List[bytes] = []
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > settings.max_upload_bytes:
+            raise _upload_too_large()
+        chunks.append(chunk)
+    content = b"".join(chunks)
+    attachment_id = await run_in_threadpool(store.save, content)
+    return AttachmentUploadResponse(
+        id=attachment_id,
+        name=name,
+        content_type=content_type,
+        size=len(content),
     )
 
+
+@router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_session(
+    session_id: str,
+    sessions: SessionStore = Depends(get_session_store),
+) -> Response:
+    """Forget the server-side context of a session."""
+
+    sessions.delete(session_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def read_metrics() -> str:
+    """Expose process counters in Prometheus text format."""
+
+    return metrics.render()
+
+
+def _upload_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Attachment exceeds {settings.max_upload_bytes} bytes",
+    )
+
+
+def _request_deadline(request: ChatRequest, header_timeout: Optional[float]) -> Deadline:
+    timeouts = [value for value in (request.timeout, header_timeout) if value]
+    return Deadline.after(min(timeouts) if timeouts else None)
+
+
+async def _until_disconnected(
+    http_request: Request, deadline: Deadline, work: Awaitable[T]
+) -> T:
+    """Await ``work`` but cancel it as soon as the client disconnects.
+
+    Cancelling the task aborts the in-flight LLM call, and cancelling the
+    deadline makes OCR running in the threadpool stop at its next checkpoint.
+    """
+
+    task = asyncio.ensure_future(work)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=_DISCONNECT_POLL_SECONDS)
+            if done:
+                return task.result()
+            if await http_request.is_disconnected():
+                metrics.increment(CLIENT_DISCONNECTS)
+                raise _ClientDisconnected()
+    finally:
+        if not task.done():
+            deadline.cancel()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+def _load_context(request: ChatRequest, sessions: SessionStore) -> Dict[str, object]:
+    context: Dict[str, object] = {}
+    if request.session_id:
+        context = sessions.load(request.session_id)
+    context.update(request.context or {})
+    return context
+
+
+def resolve_attachments(
+    attachments: Optional[List[Attachment]], store: AttachmentStore
+) -> List[Dict[str, object]]:
+    """Convert attachment schemas to agent payloads, locating uploads by id."""
+
+    resolved: List[Dict[str, object]] = []
+    for attachment in attachments or []:
+        payload = attachment.dict()
+        if attachment.id:
+            try:
+                payload["path"] = str(store.path_for(attachment.id))
+            except AttachmentNotFoundError as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Unknown attachment id '{attachment.id}'",
+                ) from exc
+        resolved.append(payload)
+    return resolved
+
+
+def _finish_chat(
+    request: ChatRequest, agent_response: AgentResponse, sessions: SessionStore
+) -> ChatResponse:
+    if request.session_id:
+        sessions.save(request.session_id, agent_response.context)
     return ChatResponse(
         agent_id=request.agent_id,
         response=agent_response.message,
-        context=agent_response.context,
+        context=agent_response.context if request.return_context else {},
+        session_id=request.session_id,
     )
+
+
+def _ndjson(event: Dict[str, object]) -> str:
+    return json.dumps(event, ensure_ascii=False) + "\n"
@@ -0,0 +1,210 @@
+"""Persistent WebSocket channel for multi-turn chat sessions."""
+
+import asyncio
+import json
+import logging
+from typing import Dict, Mapping, Optional
+
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+
+from ..agents.base import AgentResponse, BaseAgent
+from ..core.deadline import Deadline, DeadlineExceeded
+from ..core.metrics import CLIENT_DISCONNECTS, DEADLINES_EXCEEDED, metrics
+from ..schemas.chat import SocketTelemetry, SocketTurn
+from ..services.agent_registry import AgentRegistry, get_agent_registry
+from ..services.attachment_store import AttachmentStore, get_attachment_store
+from ..services.llm_service import LLMServiceError
+from ..services.session_store import SessionStore, get_session_store
+from .routes import resolve_attachments
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.websocket("/ws/chat")
+async def chat_socket(
+    websocket: WebSocket,
+    agent_id: str = "ocr",
+    session_id: Optional[str] = None,
+    registry: AgentRegistry = Depends(get_agent_registry),
+    sessions: SessionStore = Depends(get_session_store),
+    store: AttachmentStore = Depends(get_attachment_store),
+) -> None:
+    """Hold a conversation open and exchange only incremental JSON frames.
+
+    Client frames carry a ``type``:
+
+    - ``message``: a ``SocketTurn``; replies stream back as ``token`` events
+      followed by ``done`` (or ``error``), all tagged with the turn ``id``.
+    - ``cancel``: abort the running turn; answered with ``cancelled``.
+    - ``telemetry``: a ``SocketTelemetry`` merged into the context used by the
+      ``device_ops`` agent.
+    - ``reset``: drop the conversation state.
+
+    Malformed or binary frames are answered with an ``error`` event and the
+    connection stays open.
+
+    State lives on the connection; pass ``session_id`` to also persist it in
+    the session store so a reconnect can resume.
+    """
+
+    await websocket.accept()
+    connection = _ChatConnection(websocket, registry, sessions, store, agent_id, session_id)
+    await connection.run()
+
+
+class _ChatConnection:
+    """Conversation state and the (at most one) running turn of a socket."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        registry: AgentRegistry,
+        sessions: SessionStore,
+        store: AttachmentStore,
+        agent_id: str,
+        session_id: Optional[str],
+    ) -> None:
+        self._websocket = websocket
+        self._registry = registry
+        self._sessions = sessions
+        self._store = store
+        self._agent_id = agent_id
+        self._session_id = session_id
+        self._context: Dict[str, object] = sessions.load(session_id) if session_id else {}
+        self._turn: Optional[asyncio.Task] = None
+        self._turn_id: Optional[str] = None
+        self._deadline: Optional[Deadline] = None
+        # Telemetry received while a turn runs; the agent works on a snapshot, so
+        # these readings are re-applied on top of the context it returns.
+        self._turn_telemetry: Dict[str, object] = {}
+        self._send_lock = asyncio.Lock()
+
+    async def run(self) -> None:
+        try:
+            while True:
+                raw = await self._receive_frame()
+                if raw is None:
+                    await self._error(
+                        None, status.HTTP_400_BAD_REQUEST, "Frames must be JSON text"
+                    )
+                else:
+                    await self._dispatch(raw)
+        except WebSocketDisconnect:
+            if self._turn_running():
+                metrics.increment(CLIENT_DISCONNECTS)
+        finally:
+            await self._cancel_turn()
+            if self._turn is not None:
+                # Retrieve the outcome so send failures after a disconnect stay quiet.
+                await asyncio.gather(self._turn, return_exceptions=True)
+
+    async def _receive_frame(self) -> Optional[str]:
+        """Return the next text frame, or ``None`` for a binary one."""
+
+        message = await self._websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", status.WS_1000_NORMAL_CLOSURE))
+        return message.get("text")
+
+    async def _dispatch(self, raw: str) -> None:
+        try:
+            frame = json.loads(raw)
+            kind = frame.get("type") if isinstance(frame, dict) else None
+            if kind == "message":
+                await self._start_turn(SocketTurn.parse_obj(frame))
+            elif kind == "cancel":
+                if self._turn_running() and frame.get("id") in (None, self._turn_id):
+                    turn_id = self._turn_id
+                    await self._cancel_turn()
+                    await self._send({"type": "cancelled", "id": turn_id})
+            elif kind == "telemetry":
+                update = SocketTelemetry.parse_obj(frame)
+                _merge_telemetry(self._context, update.telemetry)
+                if self._turn_running():
+                    self._turn_telemetry.update(update.telemetry)
+            elif kind == "reset":
+                await self._cancel_turn()
+                self._context = {}
+                if self._session_id:
+                    self._sessions.delete(self._session_id)
+            else:
+                await self._error(None, status.HTTP_400_BAD_REQUEST, f"Unknown frame type {kind!r}")
+        except (ValueError, ValidationError) as exc:
+            await self._error(None, status.HTTP_422_UNPROCESSABLE_ENTITY, str(exc))
+
+    async def _start_turn(self, turn: SocketTurn) -> None:
+        if self._turn_running():
+            await self._error(turn.id, status.HTTP_409_CONFLICT, "A turn is already in progress")
+            return
+        try:
+            agent = self._registry.get_agent(turn.agent_id or self._agent_id)
+        except HTTPException as exc:
+            await self._error(turn.id, exc.status_code, str(exc.detail))
+            return
+        self._agent_id = turn.agent_id or self._agent_id
+        if turn.context:
+            self._context.update(turn.context)
+        self._turn_id = turn.id
+        self._turn_telemetry = {}
+        self._deadline = Deadline.after(turn.timeout)
+        self._turn = asyncio.create_task(self._run_turn(agent, turn, self._deadline))
+
+    async def _run_turn(self, agent: BaseAgent, turn: SocketTurn, deadline: Deadline) -> None:
+        try:
+            async for item in agent.stream_message(
+                message=turn.message,
+                context=dict(self._context),
+                attachments=resolve_attachments(turn.attachments, self._store),
+                deadline=deadline,
+            ):
+                if isinstance(item, AgentResponse):
+                    self._context = item.context
+                    if self._turn_telemetry:
+                        _merge_telemetry(self._context, self._turn_telemetry)
+                    if self._session_id:
+                        self._sessions.save(self._session_id, self._context)
+                    await self._send({"type": "done", "id": turn.id, "response": item.message})
+                else:
+                    await self._send({"type": "token", "id": turn.id, "content": item})
+        except DeadlineExceeded as exc:
+            metrics.increment(DEADLINES_EXCEEDED)
+            await self._error(turn.id, status.HTTP_504_GATEWAY_TIMEOUT, str(exc))
+        except HTTPException as exc:
+            await self._error(turn.id, exc.status_code, str(exc.detail))
+        except (LLMServiceError, httpx.HTTPError) as exc:
+            await self._error(turn.id, status.HTTP_502_BAD_GATEWAY, str(exc))
+        except Exception:
+            # Keep the connection usable for the next turn instead of dropping it.
+            logger.exception("WebSocket turn %s failed", turn.id)
+            await self._error(turn.id, status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal error")
+
+    def _turn_running(self) -> bool:
+        return self._turn is not None and not self._turn.done()
+
+    async def _cancel_turn(self) -> None:
+        if not self._turn_running():
+            return
+        assert self._turn is not None and self._deadline is not None
+        self._deadline.cancel()
+        self._turn.cancel()
+        await asyncio.gather(self._turn, return_exceptions=True)
+
+    async def _error(self, turn_id: Optional[str], status_code: int, detail: str) -> None:
+        await self._send(
+            {"type": "error", "id": turn_id, "status_code": status_code, "detail": detail}
+        )
+
+    async def _send(self, event: Dict[str, object]) -> None:
+        async with self._send_lock:
+            await self._websocket.send_text(json.dumps(event, ensure_ascii=False))
+
+
+def _merge_telemetry(context: Dict[str, object], update: Mapping[str, object]) -> None:
+    telemetry = context.get("telemetry")
+    merged = dict(telemetry) if isinstance(telemetry, dict) else {}
+    merged.update(update)
+    context["telemetry"] = merged
@@ -1,7 +1,9 @@
 """Application configuration and settings."""
 
+import tempfile
 from functools import lru_cache
-from typing import List
+from pathlib import Path
+from typing import List, Optional
 
 from pydantic import BaseSettings, Field
 
@@ -15,6 +17,25 @@ class Settings(BaseSettings):
         env="AGENTICAI_CORS_ALLOW_ORIGINS",
     )
     ollama_base_url: str = Field("http://localhost:11434", env="OLLAMA_BASE_URL")
+    upload_dir: Path = Field(
+        default_factory=lambda: Path(tempfile.gettempdir()) / "agenticai-uploads",
+        env="AGENTICAI_UPLOAD_DIR",
+    )
+    max_upload_bytes: int = Field(20 * 1024 * 1024, env="AGENTICAI_MAX_UPLOAD_BYTES")
+    attachment_ttl_seconds: float = Field(
+        24 * 3600.0, env="AGENTICAI_ATTACHMENT_TTL_SECONDS"
+    )
+    session_ttl_seconds: float = Field(3600.0, env="AGENTICAI_SESSION_TTL_SECONDS")
+    max_sessions: int = Field(10_000, env="AGENTICAI_MAX_SESSIONS")
+    answer_cache_enabled: bool = Field(False, env="AGENTICAI_ANSWER_CACHE_ENABLED")
+    answer_cache_threshold: float = Field(0.9, env="AGENTICAI_ANSWER_CACHE_THRESHOLD")
+    answer_cache_max_bytes: int = Field(
+        32 * 1024 * 1024, env="AGENTICAI_ANSWER_CACHE_MAX_BYTES"
+    )
+    embedding_model: str = Field("nomic-embed-text", env="AGENTICAI_EMBEDDING_MODEL")
+    admin_token: Optional[str] = Field(None, env="AGENTICAI_ADMIN_TOKEN")
+    profiling_enabled: bool = Field(False, env="AGENTICAI_PROFILING_ENABLED")
+    max_stored_profiles: int = Field(32, env="AGENTICAI_MAX_STORED_PROFILES")
 
     class Config:
         env_file = ".env"
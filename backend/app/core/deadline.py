@@ -0,0 +1,59 @@
+"""Per-request deadlines shared between the event loop and worker threads."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+class DeadlineExceeded(RuntimeError):
+    """Raised when a request ran out of time or was cancelled by its client."""
+
+
+@dataclass
+class Deadline:
+    """Absolute expiry time plus a cancellation flag visible from any thread."""
+
+    expires_at: Optional[float] = None
+    _cancelled: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @classmethod
+    def after(cls, seconds: Optional[float]) -> "Deadline":
+        if seconds is None:
+            return cls()
+        return cls(expires_at=time.monotonic() + seconds)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before expiry, ``None`` when the request is unbounded."""
+
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def timeout(self, default: float) -> float:
+        """Clamp ``default`` to the time left on the deadline."""
+
+        remaining = self.remaining()
+        return default if remaining is None else min(default, remaining)
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return self.cancelled or (remaining is not None and remaining <= 0)
+
+    def check(self) -> None:
+        """Raise ``DeadlineExceeded`` once the request should stop working."""
+
+        if self.cancelled:
+            raise DeadlineExceeded("Request was cancelled")
+        if self.expired:
+            raise DeadlineExceeded("Request deadline exceeded")
@@ -0,0 +1,50 @@
+"""Minimal process-local counters exposed in Prometheus text format."""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Tuple
+
+
+class Metrics:
+    """Thread-safe registry of monotonically increasing counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Tuple[str, float]] = {}
+
+    def register(self, name: str, help_text: str) -> None:
+        with self._lock:
+            self._counters.setdefault(name, (help_text, 0.0))
+
+    def increment(self, name: str, value: float = 1.0) -> None:
+        with self._lock:
+            help_text, current = self._counters.get(name, ("", 0.0))
+            self._counters[name] = (help_text, current + value)
+
+    def value(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, ("", 0.0))[1]
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            for name, (help_text, value) in sorted(self._counters.items()):
+                if help_text:
+                    lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+LLM_WASTED_SECONDS = "agenticai_llm_wasted_seconds_total"
+CLIENT_DISCONNECTS = "agenticai_client_disconnects_total"
+DEADLINES_EXCEEDED = "agenticai_deadlines_exceeded_total"
+
+metrics.register(
+    LLM_WASTED_SECONDS, "Model time spent on generations that were abandoned."
+)
+metrics.register(CLIENT_DISCONNECTS, "Requests cancelled because the client left.")
+metrics.register(DEADLINES_EXCEEDED, "Requests that ran past their deadline.")
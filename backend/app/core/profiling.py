@@ -0,0 +1,165 @@
+"""Opt-in CPU profiling helpers for diagnosing slow workers.
+
+The middleware and debug routes are only installed when profiling is enabled
+in the settings, so a disabled deployment pays no per-request cost.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import hmac
+import io
+import marshal
+import pstats
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+ADMIN_TOKEN_HEADER = "x-admin-token"
+
+
+def is_admin(token: Optional[str], expected: Optional[str]) -> bool:
+    """Constant-time token check; always false when no admin token is set."""
+
+    if not expected or not token:
+        return False
+    return hmac.compare_digest(token.encode("utf-8"), expected.encode("utf-8"))
+
+
+class ProfileStore:
+    """Keeps the most recent per-request profiles in memory."""
+
+    def __init__(self, max_profiles: int = 32) -> None:
+        self._max_profiles = max_profiles
+        self._profiles: "OrderedDict[str, Dict[object, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(self, profile_id: str, profiler: cProfile.Profile) -> None:
+        profiler.create_stats()
+        with self._lock:
+            self._profiles[profile_id] = profiler.stats  # type: ignore[attr-defined]
+            while len(self._profiles) > self._max_profiles:
+                self._profiles.popitem(last=False)
+
+    def dump(self, profile_id: str) -> Optional[bytes]:
+        """Return the profile in the format written by ``Profile.dump_stats``."""
+
+        with self._lock:
+            stats = self._profiles.get(profile_id)
+        return marshal.dumps(stats) if stats is not None else None
+
+    def render(self, profile_id: str, limit: int = 50) -> Optional[str]:
+        """Return a human readable summary sorted by cumulative time."""
+
+        with self._lock:
+            stats = self._profiles.get(profile_id)
+        if stats is None:
+            return None
+        buffer = io.StringIO()
+        report = pstats.Stats(_StatsSource(dict(stats)), stream=buffer)
+        report.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return buffer.getvalue()
+
+
+class _StatsSource:
+    """Adapter letting ``pstats.Stats`` load an in-memory stats dict."""
+
+    def __init__(self, stats: Dict[object, object]) -> None:
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class ProfilingMiddleware:
+    """Profile individual requests that send ``X-Profile: 1`` with an admin token.
+
+    The profile id is returned in the ``X-Profile-Id`` response header and the
+    dump can be fetched from ``/debug/profiles/{id}``. ``cProfile`` only sees the
+    event-loop thread, so time spent in the threadpool (for example OCR) shows
+    up as waiting; use the sampling profiler for those. Only one request is
+    profiled at a time, but the profiler is attached to the event loop, not to
+    the request: every coroutine that runs while the profiled request is in
+    flight (other requests, WebSocket turns, background tasks) is recorded in
+    the same dump. Profile on an otherwise idle worker for a clean picture.
+    """
+
+    def __init__(self, app: ASGIApp, store: ProfileStore, admin_token: Optional[str]) -> None:
+        self.app = app
+        self._store = store
+        self._admin_token = admin_token
+        self._busy = threading.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        if not self._busy.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(PROFILE_ID_HEADER, profile_id)
+            await send(message)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send_with_profile_id)
+            finally:
+                profiler.disable()
+                self._store.save(profile_id, profiler)
+        finally:
+            self._busy.release()
+
+    def _wants_profile(self, scope: Scope) -> bool:
+        headers = Headers(scope=scope)
+        if headers.get(PROFILE_HEADER) not in ("1", "true"):
+            return False
+        return is_admin(headers.get(ADMIN_TOKEN_HEADER), self._admin_token)
+
+
+def sample_stacks(seconds: float, interval: float = 0.005) -> "Counter[str]":
+    """Sample the Python stacks of every thread in this process.
+
+    Blocks for ``seconds``; run it in a worker thread. Each key is a collapsed
+    stack (root first, frames joined by ``;``) prefixed with the thread name.
+    """
+
+    own_ident = threading.get_ident()
+    counts: "Counter[str]" = Counter()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            stack: List[str] = []
+            current = frame
+            while current is not None:
+                code = current.f_code
+                filename = code.co_filename.rsplit("/", 1)[-1]
+                stack.append(f"{code.co_name} ({filename})")
+                current = current.f_back
+            stack.append(names.get(ident, f"thread-{ident}"))
+            counts[";".join(reversed(stack))] += 1
+        time.sleep(interval)
+    return counts
+
+
+def render_collapsed(counts: "Counter[str]") -> str:
+    """Format samples as collapsed stacks consumable by ``flamegraph.pl``."""
+
+    return "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
@@ -6,8 +6,11 @@ from typing import AsyncIterator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .api.debug import profile_store, router as debug_router
 from .api.routes import router as api_router
+from .api.websocket import router as websocket_router
 from .core.config import settings
+from .core.profiling import ProfilingMiddleware
 from .services.llm_service import shutdown_llm_service
 
 
@@ -39,6 +42,16 @@ def create_app() -> FastAPI:
     )
 
     app.include_router(api_router, prefix="/api")
+    app.include_router(websocket_router, prefix="/api")
+
+    # Profiling stays completely out of the request path unless switched on.
+    if settings.profiling_enabled and settings.admin_token:
+        app.add_middleware(
+            ProfilingMiddleware,
+            store=profile_store,
+            admin_token=settings.admin_token,
+        )
+        app.include_router(debug_router, prefix="/debug")
 
     return app
 
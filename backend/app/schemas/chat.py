@@ -9,6 +9,10 @@ class Attachment(BaseModel):
     """Attachment metadata for uploaded files."""
 
     name: str = Field(..., description="Filename or logical name of the attachment")
+    id: Optional[str] = Field(
+        None,
+        description="Identifier returned by POST /api/attachments for pre-uploaded files",
+    )
     content_type: Optional[str] = Field(
         None, description="MIME type to guide processing"
     )
@@ -41,6 +45,25 @@ class ChatRequest(BaseModel):
         default=None,
         description="Optional attachments such as documents or images",
     )
+    session_id: Optional[str] = Field(
+        default=None,
+        description=(
+            "Keep conversation state on the server under this id. The supplied"
+            " context is merged on top of the stored one."
+        ),
+    )
+    return_context: bool = Field(
+        default=True,
+        description="Include the updated context in the response body",
+    )
+    timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Seconds the client is willing to wait. Combined with the"
+            " X-Request-Timeout header, the smaller value wins."
+        ),
+    )
 
 
 class ChatResponse(BaseModel):
@@ -49,3 +72,36 @@ class ChatResponse(BaseModel):
     agent_id: str
     response: str
     context: Dict[str, Any] = Field(default_factory=dict)
+    session_id: Optional[str] = None
+
+
+class AttachmentUploadResponse(BaseModel):
+    """Handle returned after uploading an attachment."""
+
+    id: str
+    name: str
+    content_type: Optional[str] = None
+    size: int
+
+
+class SocketTurn(BaseModel):
+    """Incremental user turn sent over the chat WebSocket."""
+
+    id: str = Field(..., description="Client chosen id echoed on every reply event")
+    message: str = Field(..., description="User message or instruction")
+    agent_id: Optional[str] = Field(
+        None, description="Switch the connection to another agent from this turn on"
+    )
+    context: Optional[Dict[str, Any]] = Field(
+        None, description="Context keys to merge into the connection state"
+    )
+    attachments: Optional[List[Attachment]] = Field(
+        None, description="Attachments, preferably pre-uploaded and referenced by id"
+    )
+    timeout: Optional[float] = Field(None, gt=0, description="Deadline for this turn")
+
+
+class SocketTelemetry(BaseModel):
+    """Telemetry update pushed in-band for the device operations agent."""
+
+    telemetry: Dict[str, Any]
@@ -1,14 +1,17 @@
 """Agent registry responsible for storing and retrieving agent instances."""
 
 from functools import lru_cache
-from typing import Dict
+from typing import Dict, Optional
 
 from fastapi import Depends, HTTPException, status
 
 from ..agents.base import BaseAgent
 from ..agents.device_ops_agent import DeviceOpsAgent
 from ..agents.ocr_agent import OCRConversationAgent
+from ..core.config import settings
+from ..services.answer_cache import SemanticAnswerCache
 from ..services.device_ops_service import DeviceOpsService
+from ..services.embedding_service import OllamaEmbeddingService
 from ..services.llm_service import LLMService, get_llm_service
 from ..services.ocr_service import OCRService
 from ..services.prompt_service import PromptService
@@ -35,6 +38,7 @@ def build_registry(
     device_ops_service: DeviceOpsService,
     prompt_service: PromptService,
     llm_service: LLMService,
+    answer_cache: Optional[SemanticAnswerCache] = None,
 ) -> AgentRegistry:
     """Create the registry with known agents."""
 
@@ -43,11 +47,13 @@ def build_registry(
             ocr_service=ocr_service,
             prompt_service=prompt_service,
             llm_service=llm_service,
+            answer_cache=answer_cache,
         ),
         "device_ops": DeviceOpsAgent(
             device_ops_service=device_ops_service,
             prompt_service=prompt_service,
             llm_service=llm_service,
+            answer_cache=answer_cache,
         ),
     }
     return AgentRegistry(agents)
@@ -71,6 +77,17 @@ def get_prompt_service() -> PromptService:
     return PromptService()
 
 
+@lru_cache
+def get_answer_cache() -> Optional[SemanticAnswerCache]:
+    if not settings.answer_cache_enabled:
+        return None
+    return SemanticAnswerCache(
+        embedder=OllamaEmbeddingService(model=settings.embedding_model),
+        threshold=settings.answer_cache_threshold,
+        max_bytes=settings.answer_cache_max_bytes,
+    )
+
+
 def get_llm_dependency() -> LLMService:
     return get_llm_service()
 
@@ -80,10 +97,12 @@ def get_agent_registry(
     device_ops_service: DeviceOpsService = Depends(get_device_ops_service),
     prompt_service: PromptService = Depends(get_prompt_service),
     llm_service: LLMService = Depends(get_llm_dependency),
+    answer_cache: Optional[SemanticAnswerCache] = Depends(get_answer_cache),
 ) -> AgentRegistry:
     return build_registry(
         ocr_service=ocr_service,
         device_ops_service=device_ops_service,
         prompt_service=prompt_service,
         llm_service=llm_service,
+        answer_cache=answer_cache,
     )
@@ -0,0 +1,201 @@
+"""Embedding-based cache that reuses answers to paraphrased questions."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+from ..core.deadline import Deadline
+from ..core.metrics import metrics
+from .embedding_service import EmbeddingService
+from .llm_service import LLMServiceError
+
+logger = logging.getLogger(__name__)
+
+ANSWER_CACHE_HITS = "agenticai_answer_cache_hits_total"
+ANSWER_CACHE_MISSES = "agenticai_answer_cache_misses_total"
+
+metrics.register(ANSWER_CACHE_HITS, "Turns answered from the semantic cache.")
+metrics.register(ANSWER_CACHE_MISSES, "Cache lookups that fell through to generation.")
+
+
+@dataclass
+class CacheLookup:
+    """Result of probing the cache, reused to store the generated answer."""
+
+    scope: Optional[str] = None
+    vector: Optional[np.ndarray] = None
+    answer: Optional[str] = None
+
+
+class _ScopeIndex:
+    """Array-backed vectors for one document or device state.
+
+    Rows are L2-normalised, so a single matrix-vector product yields the cosine
+    similarity against every cached question. Capacity doubles when full and
+    halves once a quarter full, starting at a single row because most scopes
+    only ever see one question.
+    """
+
+    def __init__(self, dimensions: int) -> None:
+        self.vectors = np.empty((1, dimensions), dtype=np.float32)
+        self.entry_ids: List[int] = []
+        self.answers: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.entry_ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the vector array, including unused capacity."""
+
+        return self.vectors.nbytes
+
+    def best_match(self, vector: np.ndarray) -> Tuple[Optional[int], float]:
+        if not self.entry_ids:
+            return None, 0.0
+        scores = self.vectors[: len(self.entry_ids)] @ vector
+        row = int(np.argmax(scores))
+        return row, float(scores[row])
+
+    def add(self, entry_id: int, vector: np.ndarray, answer: str) -> None:
+        size = len(self.entry_ids)
+        if size == self.vectors.shape[0]:
+            self._resize(size * 2)
+        self.vectors[size] = vector
+        self.entry_ids.append(entry_id)
+        self.answers.append(answer)
+
+    def remove(self, entry_id: int) -> None:
+        row = self.entry_ids.index(entry_id)
+        last = len(self.entry_ids) - 1
+        if row != last:
+            self.vectors[row] = self.vectors[last]
+            self.entry_ids[row] = self.entry_ids[last]
+            self.answers[row] = self.answers[last]
+        self.entry_ids.pop()
+        self.answers.pop()
+        capacity = self.vectors.shape[0]
+        if capacity > 1 and len(self.entry_ids) <= capacity // 4:
+            self._resize(capacity // 2)
+
+    def _resize(self, capacity: int) -> None:
+        size = len(self.entry_ids)
+        resized = np.empty((capacity, self.vectors.shape[1]), dtype=np.float32)
+        resized[:size] = self.vectors[:size]
+        self.vectors = resized
+
+
+@dataclass
+class SemanticAnswerCache:
+    """Scoped nearest-neighbour cache with LRU eviction under a memory cap.
+
+    Answers are only shared between questions about the same scope (a document
+    hash or telemetry snapshot), and only when the cosine similarity of the
+    question embeddings reaches ``threshold``. After ``failure_threshold``
+    consecutive embedding failures the cache is bypassed for
+    ``cooldown_seconds`` so an unavailable embedding model does not add a
+    failing request to every turn.
+    """
+
+    embedder: EmbeddingService
+    threshold: float = 0.9
+    max_bytes: int = 32 * 1024 * 1024
+    failure_threshold: int = 3
+    cooldown_seconds: float = 60.0
+    _scopes: Dict[str, _ScopeIndex] = field(default_factory=dict, init=False, repr=False)
+    _lru: "OrderedDict[int, Tuple[str, int]]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _ids: "itertools.count[int]" = field(default_factory=itertools.count, init=False, repr=False)
+    _bytes: int = field(default=0, init=False, repr=False)
+    _failures: int = field(default=0, init=False, repr=False)
+    _bypass_until: float = field(default=0.0, init=False, repr=False)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    async def lookup(
+        self, scope: str, query: str, deadline: Optional[Deadline] = None
+    ) -> CacheLookup:
+        if time.monotonic() < self._bypass_until:
+            return CacheLookup()
+        try:
+            vector = await self.embedder.embed(query, deadline=deadline)
+        except (httpx.HTTPError, LLMServiceError) as exc:
+            # The cache is an optimisation; generation proceeds without it.
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._failures = 0
+                self._bypass_until = time.monotonic() + self.cooldown_seconds
+                logger.warning(
+                    "Embedding failed, bypassing answer cache for %.0fs: %s",
+                    self.cooldown_seconds,
+                    exc,
+                )
+            else:
+                logger.warning("Embedding failed, bypassing answer cache: %s", exc)
+            return CacheLookup()
+        self._failures = 0
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return CacheLookup()
+        vector = (vector / norm).astype(np.float32, copy=False)
+
+        index = self._scopes.get(scope)
+        if index is not None and index.vectors.shape[1] == vector.shape[0]:
+            row, score = index.best_match(vector)
+            if row is not None and score >= self.threshold:
+                self._lru.move_to_end(index.entry_ids[row])
+                metrics.increment(ANSWER_CACHE_HITS)
+                return CacheLookup(scope=scope, vector=vector, answer=index.answers[row])
+        metrics.increment(ANSWER_CACHE_MISSES)
+        return CacheLookup(scope=scope, vector=vector)
+
+    def store(self, lookup: CacheLookup, answer: str) -> None:
+        if lookup.scope is None or lookup.vector is None or lookup.answer is not None:
+            return
+        # ``_bytes`` counts the allocated vector arrays (spare capacity included)
+        # plus the encoded answers; the LRU only tracks the answer sizes.
+        answer_size = len(answer.encode("utf-8"))
+        if lookup.vector.nbytes + answer_size > self.max_bytes:
+            return
+        index = self._scopes.get(lookup.scope)
+        if index is None or index.vectors.shape[1] != lookup.vector.shape[0]:
+            if index is not None:
+                self._drop_scope(lookup.scope)
+            index = self._scopes[lookup.scope] = _ScopeIndex(lookup.vector.shape[0])
+            self._bytes += index.nbytes
+        entry_id = next(self._ids)
+        allocated = index.nbytes
+        index.add(entry_id, lookup.vector, answer)
+        self._lru[entry_id] = (lookup.scope, answer_size)
+        self._bytes += index.nbytes - allocated + answer_size
+        while self._bytes > self.max_bytes and self._lru:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        entry_id, (scope, answer_size) = self._lru.popitem(last=False)
+        index = self._scopes[scope]
+        allocated = index.nbytes
+        index.remove(entry_id)
+        if index:
+            self._bytes -= allocated - index.nbytes + answer_size
+        else:
+            del self._scopes[scope]
+            self._bytes -= allocated + answer_size
+
+    def _drop_scope(self, scope: str) -> None:
+        index = self._scopes.pop(scope)
+        self._bytes -= index.nbytes
+        for entry_id in index.entry_ids:
+            _, answer_size = self._lru.pop(entry_id)
+            self._bytes -= answer_size
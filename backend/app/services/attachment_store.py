@@ -0,0 +1,87 @@
+"""Content-addressed storage for attachments uploaded ahead of a conversation."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from ..core.config import settings
+
+_ATTACHMENT_ID = re.compile(r"^[0-9a-f]{64}$")
+
+
+class AttachmentNotFoundError(LookupError):
+    """Raised when an attachment id does not refer to a stored upload."""
+
+
+@dataclass
+class AttachmentStore:
+    """Persist uploads on disk keyed by the SHA-256 digest of their content.
+
+    Identical payloads map to the same id, so clients can upload a file once and
+    reference it on every later turn instead of re-sending the bytes. Uploads
+    and lookups refresh a file's modification time; files untouched for
+    ``ttl_seconds`` are deleted by a sweep that runs at most once per
+    ``prune_interval_seconds`` when new uploads arrive.
+    """
+
+    root: Path
+    ttl_seconds: float = 24 * 3600.0
+    prune_interval_seconds: float = 300.0
+    _last_pruned: float = field(default=0.0, init=False, repr=False)
+
+    def save(self, content: bytes) -> str:
+        attachment_id = hashlib.sha256(content).hexdigest()
+        target = self.root / attachment_id
+        if target.exists():
+            os.utime(target)
+        else:
+            self.root.mkdir(parents=True, exist_ok=True)
+            partial = target.with_suffix(".part")
+            partial.write_bytes(content)
+            partial.replace(target)
+        if time.monotonic() - self._last_pruned >= self.prune_interval_seconds:
+            self.prune()
+        return attachment_id
+
+    def path_for(self, attachment_id: str) -> Path:
+        """Return the on-disk location of a previously uploaded attachment."""
+
+        if not _ATTACHMENT_ID.match(attachment_id):
+            raise AttachmentNotFoundError(attachment_id)
+        target = self.root / attachment_id
+        try:
+            os.utime(target)
+        except FileNotFoundError as exc:
+            raise AttachmentNotFoundError(attachment_id) from exc
+        return target
+
+    def prune(self) -> int:
+        """Delete attachments idle for longer than the TTL; return how many."""
+
+        self._last_pruned = time.monotonic()
+        if not self.root.is_dir():
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        removed = 0
+        for entry in self.root.iterdir():
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    entry.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+
+@lru_cache
+def get_attachment_store() -> AttachmentStore:
+    return AttachmentStore(
+        root=settings.upload_dir,
+        ttl_seconds=settings.attachment_ttl_seconds,
+    )
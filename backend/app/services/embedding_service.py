@@ -0,0 +1,59 @@
+"""Text embedding providers used by the semantic answer cache."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from ..core.deadline import Deadline
+from .llm_service import LLMService, get_llm_service
+
+
+class EmbeddingService(ABC):
+    """Turns text into fixed-size vectors."""
+
+    @abstractmethod
+    async def embed(self, text: str, deadline: Optional[Deadline] = None) -> np.ndarray:
+        """Return a one-dimensional ``float32`` vector for ``text``."""
+
+
+@dataclass
+class OllamaEmbeddingService(EmbeddingService):
+    """Embeddings served by the same backend as text generation.
+
+    Without an explicit ``llm_service`` the shared application client is looked
+    up on every call, so the cache survives that client being recreated.
+    """
+
+    model: str = "nomic-embed-text"
+    llm_service: Optional[LLMService] = None
+
+    async def embed(self, text: str, deadline: Optional[Deadline] = None) -> np.ndarray:
+        llm_service = self.llm_service or get_llm_service()
+        vector = await llm_service.embed(text, model=self.model, deadline=deadline)
+        return np.asarray(vector, dtype=np.float32)
+
+
+@dataclass
+class FakeEmbeddingService(EmbeddingService):
+    """Deterministic hashed bag-of-words embeddings for tests and offline runs.
+
+    Texts sharing words land close together, which is enough to exercise the
+    cache without a model server.
+    """
+
+    dimensions: int = 256
+
+    async def embed(self, text: str, deadline: Optional[Deadline] = None) -> np.ndarray:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for token in re.findall(r"\w+", text.lower()):
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest, "little")
+            sign = 1.0 if bucket & 1 else -1.0
+            vector[(bucket >> 1) % self.dimensions] += sign
+        return vector
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import AsyncIterator, Dict, List
 
 import httpx
 
 from ..core.config import settings
+from ..core.deadline import Deadline, DeadlineExceeded
+from ..core.metrics import LLM_WASTED_SECONDS, metrics
 
 
 class LLMServiceError(RuntimeError):
@@ -25,9 +30,25 @@ class LLMService:
     def __post_init__(self) -> None:
         self._client = httpx.AsyncClient(base_url=settings.ollama_base_url, timeout=self.timeout)
 
-    async def complete(self, prompt: str, stream: bool = False) -> str:
+    async def complete(
+        self, prompt: str, stream: bool = False, deadline: Deadline | None = None
+    ) -> str:
         payload: Dict[str, object] = {"model": self.model, "prompt": prompt, "stream": stream}
-        response = await self._client.post("/api/generate", json=payload)
+        if deadline is not None:
+            deadline.check()
+        started = time.monotonic()
+        try:
+            response = await asyncio.wait_for(
+                self._client.post("/api/generate", json=payload),
+                timeout=deadline.remaining() if deadline is not None else None,
+            )
+        except asyncio.TimeoutError as exc:
+            self._record_wasted(started)
+            raise DeadlineExceeded("LLM generation exceeded the request deadline") from exc
+        except asyncio.CancelledError:
+            # Cancelling the request closes the connection, which stops Ollama.
+            self._record_wasted(started)
+            raise
         response.raise_for_status()
         data = response.json()
         if isinstance(data, dict) and "response" in data:
@@ -36,6 +57,70 @@ class LLMService:
             raise LLMServiceError("Response payload missing 'response' field")
         return str(data)
 
+    async def stream(
+        self, prompt: str, deadline: Deadline | None = None
+    ) -> AsyncIterator[str]:
+        """Yield response tokens as the provider produces them."""
+
+        payload: Dict[str, object] = {"model": self.model, "prompt": prompt, "stream": True}
+        if deadline is not None:
+            deadline.check()
+        started = time.monotonic()
+        try:
+            async with self._client.stream("POST", "/api/generate", json=payload) as response:
+                response.raise_for_status()
+                lines = response.aiter_lines()
+                while True:
+                    try:
+                        line = await asyncio.wait_for(
+                            lines.__anext__(),
+                            timeout=deadline.remaining() if deadline is not None else None,
+                        )
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError as exc:
+                        raise DeadlineExceeded(
+                            "LLM generation exceeded the request deadline"
+                        ) from exc
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    if not isinstance(data, dict):
+                        raise LLMServiceError("Unexpected streaming payload")
+                    if "error" in data:
+                        raise LLMServiceError(str(data["error"]))
+                    token = data.get("response")
+                    if token:
+                        yield str(token)
+                    if data.get("done"):
+                        break
+        except (asyncio.CancelledError, GeneratorExit, DeadlineExceeded):
+            self._record_wasted(started)
+            raise
+
+    async def embed(
+        self, text: str, model: str, deadline: Deadline | None = None
+    ) -> List[float]:
+        """Return the embedding vector for ``text`` from the embeddings endpoint."""
+
+        payload: Dict[str, object] = {"model": model, "prompt": text}
+        try:
+            response = await asyncio.wait_for(
+                self._client.post("/api/embeddings", json=payload),
+                timeout=deadline.remaining() if deadline is not None else None,
+            )
+        except asyncio.TimeoutError as exc:
+            raise DeadlineExceeded("Embedding exceeded the request deadline") from exc
+        response.raise_for_status()
+        data = response.json()
+        if not isinstance(data, dict) or not isinstance(data.get("embedding"), list):
+            raise LLMServiceError("Response payload missing 'embedding' field")
+        return [float(value) for value in data["embedding"]]
+
+    @staticmethod
+    def _record_wasted(started: float) -> None:
+        metrics.increment(LLM_WASTED_SECONDS, time.monotonic() - started)
+
     async def aclose(self) -> None:
         await self._client.aclose()
 
@@ -3,8 +3,69 @@
 from __future__ import annotations
 
 import base64
+import hashlib
+import io
+import logging
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Mapping, Tuple
+from typing import Iterable, List, Mapping, Optional, Tuple
+
+from ..core.deadline import Deadline
+
+try:  # Optional: enables the text-layer fast path for born-digital PDFs.
+    from pypdf import PageObject, PdfReader
+    from pypdf.errors import DependencyError, PyPdfError
+except ImportError:  # pragma: no cover - every PDF page is OCRed instead
+    PageObject = None  # type: ignore[assignment,misc]
+    PdfReader = None  # type: ignore[assignment,misc]
+
+    class PyPdfError(Exception):  # type: ignore[no-redef]
+        """Stand-in so the except clauses below stay valid without pypdf."""
+
+    DependencyError = PyPdfError  # type: ignore[assignment,misc]
+
+
+logger = logging.getLogger(__name__)
+
+# pypdf reports most parse problems as ``PyPdfError`` but malformed objects and
+# unsupported encryption still surface as built-in exceptions. AES-encrypted
+# files raise ``DependencyError`` (not a ``PyPdfError``) unless the optional
+# ``cryptography`` package is installed.
+_PDF_ERRORS = (
+    PyPdfError,
+    DependencyError,
+    ValueError,
+    KeyError,
+    TypeError,
+    NotImplementedError,
+)
+
+
+@dataclass
+class PageExtraction:
+    """Text of a single page and how it was obtained (``text_layer`` or ``ocr``)."""
+
+    page_number: int
+    method: str
+    text: str
+
+
+@dataclass
+class DocumentExtraction:
+    """Per-page extraction results for one attachment.
+
+    ``digest`` is the SHA-256 of the bytes that were actually read, never the
+    client-supplied id, so it can safely scope answers shared between users.
+    """
+
+    name: str
+    content_type: str
+    digest: str
+    pages: List[PageExtraction] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(page.text for page in self.pages)
 
 
 class OCRService:
@@ -15,35 +76,138 @@ class OCRService:
         "image/jpeg",
         "application/pdf",
     )
+    # Pages with fewer alphanumeric characters in their text layer are treated
+    # as scanned images; this skips blank layers and stray page numbers.
+    MIN_TEXT_LAYER_CHARS: int = 20
 
-    def run_ocr(self, attachments: Iterable[Mapping[str, object]]) -> List[str]:
-        """Run OCR on attachments, returning extracted text segments."""
+    def run_ocr(
+        self,
+        attachments: Iterable[Mapping[str, object]],
+        deadline: Optional[Deadline] = None,
+    ) -> List[str]:
+        """Run OCR on attachments, returning extracted text segments.
+
+        The deadline is checked before each attachment so a cancelled request
+        releases the worker thread without finishing the remaining documents.
+        """
 
-        texts: List[str] = []
         attachments_list = list(attachments)
-        for attachment in attachments_list:
+        documents = self.extract_documents(attachments_list, deadline)
+        return self.document_texts(documents, attachments_list)
+
+    def extract_documents(
+        self,
+        attachments: Iterable[Mapping[str, object]],
+        deadline: Optional[Deadline] = None,
+    ) -> List[DocumentExtraction]:
+        """Extract text per page, reading PDF text layers directly when usable."""
+
+        documents: List[DocumentExtraction] = []
+        for attachment in attachments:
+            if deadline is not None:
+                deadline.check()
             content_type = str(attachment.get("content_type")) if attachment.get("content_type") else None
             if content_type not in self.SUPPORTED_TYPES:
                 continue
 
-            data = attachment.get("data")
-            if isinstance(data, str) and data:
-                decoded = base64.b64decode(data)
-                texts.append(self._fake_ocr(decoded, content_type))
+            content = self._read_content(attachment)
+            if content is None:
                 continue
 
-            path = attachment.get("path")
-            if isinstance(path, (str, Path)):
-                texts.append(self._fake_ocr(Path(path).read_bytes(), content_type))
+            document = DocumentExtraction(
+                name=str(attachment.get("name", "")),
+                content_type=content_type,
+                digest=hashlib.sha256(content).hexdigest(),
+            )
+            if content_type == "application/pdf":
+                document.pages = self._extract_pdf(content, deadline)
+            else:
+                document.pages = [
+                    PageExtraction(1, "ocr", self._fake_ocr(content, content_type))
+                ]
+            documents.append(document)
+        return documents
 
+    @staticmethod
+    def document_texts(
+        documents: List[DocumentExtraction],
+        attachments: List[Mapping[str, object]],
+    ) -> List[str]:
+        """Flatten extractions into one text segment per document."""
+
+        texts = [document.text for document in documents]
         if not texts:
-            if attachments_list:
+            if attachments:
                 texts.append("[Attachments were provided but none were OCR-compatible]")
             else:
                 texts.append("[No attachments provided]")
-
         return texts
 
+    @staticmethod
+    def _read_content(attachment: Mapping[str, object]) -> Optional[bytes]:
+        data = attachment.get("data")
+        if isinstance(data, str) and data:
+            return base64.b64decode(data)
+
+        path = attachment.get("path")
+        if isinstance(path, (str, Path)):
+            return Path(path).read_bytes()
+        return None
+
+    def _extract_pdf(
+        self, content: bytes, deadline: Optional[Deadline]
+    ) -> List[PageExtraction]:
+        if PdfReader is None:
+            return [PageExtraction(1, "ocr", self._fake_ocr(content, "application/pdf"))]
+        try:
+            reader = PdfReader(io.BytesIO(content))
+            if reader.is_encrypted:
+                reader.decrypt("")
+            pdf_pages = list(reader.pages)
+        except _PDF_ERRORS as exc:  # Malformed or protected PDFs go through OCR whole.
+            logger.warning("Cannot read PDF structure, running OCR on the file: %s", exc)
+            return [PageExtraction(1, "ocr", self._fake_ocr(content, "application/pdf"))]
+
+        pages: List[PageExtraction] = []
+        for page_number, page in enumerate(pdf_pages, start=1):
+            if deadline is not None:
+                deadline.check()
+            text = self._text_layer(page)
+            if self._is_usable_text_layer(text):
+                pages.append(PageExtraction(page_number, "text_layer", text))
+            else:
+                pages.append(
+                    PageExtraction(page_number, "ocr", self._ocr_pdf_page(content, page_number))
+                )
+        return pages
+
+    @staticmethod
+    def _text_layer(page: "PageObject") -> str:
+        """Extract embedded text keeping the visual reading order of the page."""
+
+        try:
+            text = page.extract_text(extraction_mode="layout")
+        except _PDF_ERRORS as exc:  # Broken content streams are handled like image pages.
+            logger.warning("Cannot extract PDF text layer, falling back to OCR: %s", exc)
+            return ""
+        # Layout mode pads lines to the page width; keep indentation, drop padding.
+        return "\n".join(line.rstrip() for line in text.splitlines()).strip("\n")
+
+    def _is_usable_text_layer(self, text: str) -> bool:
+        if sum(char.isalnum() for char in text) < self.MIN_TEXT_LAYER_CHARS:
+            return False
+        # Fonts without a unicode mapping extract as replacement or control chars.
+        garbled = sum(
+            char == "\ufffd" or (not char.isprintable() and not char.isspace())
+            for char in text
+        )
+        return garbled <= len(text) * 0.05
+
+    def _ocr_pdf_page(self, content: bytes, page_number: int) -> str:
+        """Placeholder for rasterising ``page_number`` and running OCR on it."""
+
+        return f"{self._fake_ocr(content, 'application/pdf')} (page {page_number})"
+
     @staticmethod
     def _fake_ocr(_: bytes, content_type: str) -> str:
         """Placeholder OCR implementation to be replaced with a real engine."""
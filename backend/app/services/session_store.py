@@ -0,0 +1,56 @@
+"""Server-side conversation state keyed by client supplied session ids."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from ..core.config import settings
+
+
+@dataclass
+class SessionStore:
+    """In-memory LRU store for conversation context with idle expiry.
+
+    State lives in the worker process, so deployments running several workers
+    should route a session to the same worker (sticky sessions).
+    """
+
+    max_sessions: int = 10_000
+    ttl_seconds: float = 3600.0
+    _sessions: "OrderedDict[str, Tuple[float, Dict[str, object]]]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+
+    def load(self, session_id: str) -> Dict[str, object]:
+        """Return a copy of the stored context, or an empty one for new sessions."""
+
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return {}
+        touched_at, context = entry
+        if time.monotonic() - touched_at > self.ttl_seconds:
+            del self._sessions[session_id]
+            return {}
+        self._sessions.move_to_end(session_id)
+        return dict(context)
+
+    def save(self, session_id: str, context: Dict[str, object]) -> None:
+        self._sessions[session_id] = (time.monotonic(), dict(context))
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    def delete(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id, None) is not None
+
+
+@lru_cache
+def get_session_store() -> SessionStore:
+    return SessionStore(
+        max_sessions=settings.max_sessions,
+        ttl_seconds=settings.session_ttl_seconds,
+    )
@@ -0,0 +1,31 @@
+import json
+from typing import Callable, List
+
+import httpx
+import pytest
+
+from backend.app.services.llm_service import LLMService
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def ollama_stream(tokens: List[str]) -> httpx.Response:
+    """Build an ``/api/generate`` streaming response emitting ``tokens``."""
+
+    lines = [json.dumps({"response": token, "done": False}) for token in tokens]
+    lines.append(json.dumps({"response": "", "done": True}))
+    return httpx.Response(200, content="\n".join(lines).encode("utf-8"))
+
+
+@pytest.fixture
+def llm_service_factory():
+    """Create ``LLMService`` instances whose HTTP calls go to ``handler``."""
+
+    def factory(handler: Handler) -> LLMService:
+        service = LLMService()
+        service._client = httpx.AsyncClient(
+            base_url="http://ollama.test", transport=httpx.MockTransport(handler)
+        )
+        return service
+
+    return factory
@@ -0,0 +1,223 @@
+import asyncio
+import base64
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+import numpy as np
+import pytest
+
+from backend.app.agents.device_ops_agent import DeviceOpsAgent
+from backend.app.agents.ocr_agent import OCRConversationAgent
+from backend.app.core.deadline import Deadline
+from backend.app.services import answer_cache as answer_cache_module
+from backend.app.services.answer_cache import SemanticAnswerCache
+from backend.app.services.device_ops_service import DeviceOpsService
+from backend.app.services.embedding_service import EmbeddingService, FakeEmbeddingService
+from backend.app.services.ocr_service import OCRService
+from backend.app.services.prompt_service import PromptService
+
+from .conftest import ollama_stream
+
+
+def lookup(cache, scope, query):
+    return asyncio.run(cache.lookup(scope, query))
+
+
+def test_paraphrase_hits_within_scope_only():
+    cache = SemanticAnswerCache(FakeEmbeddingService(), threshold=0.8)
+    miss = lookup(cache, "doc-a", "what is the invoice total")
+    assert miss.answer is None
+    cache.store(miss, "42 EUR")
+
+    assert lookup(cache, "doc-a", "What is the invoice total?").answer == "42 EUR"
+    assert lookup(cache, "doc-b", "what is the invoice total").answer is None
+    assert lookup(cache, "doc-a", "who signed the contract").answer is None
+
+
+def test_cache_hits_are_not_stored_again():
+    cache = SemanticAnswerCache(FakeEmbeddingService())
+    cache.store(lookup(cache, "doc", "invoice total"), "42")
+    size = cache.size_bytes
+
+    hit = lookup(cache, "doc", "invoice total")
+    cache.store(hit, hit.answer)
+
+    assert cache.size_bytes == size
+
+
+def test_least_recently_used_entries_are_evicted_under_max_bytes():
+    embedder = FakeEmbeddingService(dimensions=16)
+    entry_size = 16 * 4 + len("answer")
+    cache = SemanticAnswerCache(embedder, max_bytes=2 * entry_size)
+    for scope in ("a", "b"):
+        cache.store(lookup(cache, scope, "question"), "answer")
+    assert lookup(cache, "a", "question").answer == "answer"
+
+    cache.store(lookup(cache, "c", "question"), "answer")
+
+    assert cache.size_bytes == 2 * entry_size
+    assert lookup(cache, "a", "question").answer == "answer"
+    assert lookup(cache, "b", "question").answer is None
+    assert lookup(cache, "c", "question").answer == "answer"
+
+
+def test_size_includes_spare_array_capacity():
+    cache = SemanticAnswerCache(FakeEmbeddingService(dimensions=16))
+    for question in ("invoice total", "due date", "vendor name"):
+        cache.store(lookup(cache, "doc", question), "a")
+
+    # Three rows live in a four-row array after doubling from one.
+    assert cache.size_bytes == 4 * 16 * 4 + 3
+
+    for _ in range(2):
+        cache._evict_oldest()
+    # Down to a quarter full, the array shrinks to two rows.
+    assert cache.size_bytes == 2 * 16 * 4 + 1
+
+    cache._evict_oldest()
+    assert cache.size_bytes == 0
+
+
+def test_max_bytes_bounds_allocated_memory():
+    entry_size = 16 * 4 + 1
+    cache = SemanticAnswerCache(FakeEmbeddingService(dimensions=16), max_bytes=4 * entry_size)
+    for question in ("alpha", "bravo", "charlie", "delta", "echo"):
+        cache.store(lookup(cache, "doc", question), "a")
+
+    assert cache.size_bytes <= cache.max_bytes
+    assert cache.size_bytes == sum(
+        index.nbytes + len(index) for index in cache._scopes.values()
+    )
+
+
+def test_oversized_answers_are_not_cached():
+    cache = SemanticAnswerCache(FakeEmbeddingService(dimensions=16), max_bytes=100)
+
+    cache.store(lookup(cache, "doc", "question"), "x" * 100)
+
+    assert cache.size_bytes == 0
+
+
+def test_embedding_dimension_change_replaces_scope():
+    embedder = FakeEmbeddingService(dimensions=16)
+    cache = SemanticAnswerCache(embedder)
+    cache.store(lookup(cache, "doc", "question"), "old")
+
+    embedder.dimensions = 32
+    miss = lookup(cache, "doc", "question")
+    assert miss.answer is None
+    cache.store(miss, "new")
+
+    assert cache.size_bytes == 32 * 4 + len("new")
+    assert lookup(cache, "doc", "question").answer == "new"
+
+
+@dataclass
+class FailingEmbeddingService(EmbeddingService):
+    calls: int = 0
+
+    async def embed(self, text: str, deadline: Optional[Deadline] = None) -> np.ndarray:
+        self.calls += 1
+        raise httpx.ConnectError("embedding model unavailable")
+
+
+def test_repeated_embedding_failures_bypass_the_cache(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(answer_cache_module.time, "monotonic", lambda: now[0])
+    embedder = FailingEmbeddingService()
+    cache = SemanticAnswerCache(embedder, failure_threshold=2, cooldown_seconds=30)
+
+    for _ in range(4):
+        assert lookup(cache, "doc", "question").answer is None
+    assert embedder.calls == 2
+
+    now[0] += 31
+    lookup(cache, "doc", "question")
+    assert embedder.calls == 3
+
+
+@pytest.fixture
+def ocr_agent(llm_service_factory):
+    prompts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        prompts.append(request.content)
+        return httpx.Response(200, json={"response": f"answer {len(prompts)}"})
+
+    agent = OCRConversationAgent(
+        ocr_service=OCRService(),
+        prompt_service=PromptService(),
+        llm_service=llm_service_factory(handler),
+        answer_cache=SemanticAnswerCache(FakeEmbeddingService()),
+    )
+    agent.generated = prompts
+    return agent
+
+
+def image(content: bytes):
+    return {
+        "name": "scan.png",
+        "content_type": "image/png",
+        "data": base64.b64encode(content).decode("ascii"),
+    }
+
+
+def ask(agent, attachments, context=None):
+    return asyncio.run(
+        agent.handle_message(
+            message="what is the total", context=context or {}, attachments=attachments
+        )
+    )
+
+
+def test_ocr_answers_are_scoped_to_attachment_bytes(ocr_agent):
+    first = ask(ocr_agent, [image(b"invoice-1")])
+    assert ask(ocr_agent, [image(b"invoice-1")]).message == first.message
+
+    # The placeholder OCR returns the same text for both images.
+    assert ask(ocr_agent, [image(b"invoice-2")]).message != first.message
+    assert len(ocr_agent.generated) == 2
+
+
+def test_follow_up_questions_bypass_the_cache(ocr_agent):
+    first = ask(ocr_agent, [image(b"invoice")])
+
+    follow_up = ask(ocr_agent, [image(b"invoice")], context=first.context)
+
+    assert follow_up.message != first.message
+    assert len(ocr_agent.generated) == 2
+
+
+def test_streamed_device_answers_are_cached_per_telemetry_state(llm_service_factory):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return ollama_stream(["Replace", " the fan"])
+
+    agent = DeviceOpsAgent(
+        device_ops_service=DeviceOpsService(),
+        prompt_service=PromptService(),
+        llm_service=llm_service_factory(handler),
+        answer_cache=SemanticAnswerCache(FakeEmbeddingService()),
+    )
+
+    async def stream(telemetry):
+        items = [
+            item
+            async for item in agent.stream_message(
+                "fan alarm?", {"telemetry": telemetry}, attachments=[]
+            )
+        ]
+        return items[:-1], items[-1]
+
+    tokens, response = asyncio.run(stream({"fan": "stopped"}))
+    cached_tokens, cached = asyncio.run(stream({"fan": "stopped"}))
+    asyncio.run(stream({"fan": "ok"}))
+
+    assert tokens == ["Replace", " the fan"]
+    assert cached_tokens == ["Replace the fan"]
+    assert cached.message == response.message == "Replace the fan"
+    assert len(cached.context["conversation_history"]) == 2
+    assert len(calls) == 2
@@ -0,0 +1,83 @@
+import os
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.core.config import settings
+from backend.app.main import app
+from backend.app.services.attachment_store import (
+    AttachmentNotFoundError,
+    AttachmentStore,
+    get_attachment_store,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return AttachmentStore(root=tmp_path / "uploads", ttl_seconds=60)
+
+
+@pytest.fixture
+def client(store):
+    app.dependency_overrides[get_attachment_store] = lambda: store
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_identical_content_shares_an_id(store):
+    first = store.save(b"invoice")
+
+    assert store.save(b"invoice") == first
+    assert store.path_for(first).read_bytes() == b"invoice"
+
+
+def test_unknown_or_malformed_ids_are_rejected(store):
+    with pytest.raises(AttachmentNotFoundError):
+        store.path_for("0" * 64)
+    with pytest.raises(AttachmentNotFoundError):
+        store.path_for("../etc/passwd")
+
+
+def test_prune_removes_idle_attachments(store):
+    stale = store.save(b"old")
+    fresh = store.save(b"new")
+    expired = time.time() - 120
+    os.utime(store.root / stale, (expired, expired))
+
+    assert store.prune() == 1
+    with pytest.raises(AttachmentNotFoundError):
+        store.path_for(stale)
+    assert store.path_for(fresh).exists()
+
+
+def test_upload_returns_handle(client):
+    response = client.post(
+        "/api/attachments",
+        params={"name": "a.png", "content_type": "image/png"},
+        content=b"abc",
+    )
+
+    assert response.status_code == 201
+    assert response.json()["size"] == 3
+    assert len(response.json()["id"]) == 64
+
+
+def test_upload_over_limit_is_rejected(client, monkeypatch):
+    monkeypatch.setattr(settings, "max_upload_bytes", 4)
+
+    response = client.post("/api/attachments", params={"name": "a"}, content=b"12345")
+
+    assert response.status_code == 413
+
+
+def test_chunked_upload_over_limit_is_rejected(client, monkeypatch):
+    monkeypatch.setattr(settings, "max_upload_bytes", 4)
+
+    response = client.post(
+        "/api/attachments",
+        params={"name": "a"},
+        content=iter([b"123", b"45"]),
+    )
+
+    assert response.status_code == 413
@@ -0,0 +1,143 @@
+import asyncio
+import json
+from typing import Dict, List, Optional
+
+import httpx
+import pytest
+
+from backend.app.agents.base import AgentResponse, BaseAgent
+from backend.app.core.deadline import Deadline, DeadlineExceeded
+from backend.app.core.metrics import CLIENT_DISCONNECTS, LLM_WASTED_SECONDS, metrics
+from backend.app.main import app
+from backend.app.services.agent_registry import AgentRegistry, get_agent_registry
+
+
+class SlowAgent(BaseAgent):
+    """Agent that never finishes, recording how it was stopped."""
+
+    def __init__(self) -> None:
+        self.deadline: Optional[Deadline] = None
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def handle_message(self, message, context, attachments, deadline=None):
+        self.deadline = deadline
+        self.started.set()
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return AgentResponse(message="too late", context=context)
+
+    async def stream_message(self, message, context, attachments, deadline=None):
+        self.deadline = deadline
+        try:
+            yield "first"
+            self.started.set()
+            await asyncio.sleep(30)
+        except (asyncio.CancelledError, GeneratorExit):
+            self.cancelled = True
+            raise
+        yield AgentResponse(message="too late", context=context)
+
+
+@pytest.fixture
+def agent():
+    agent = SlowAgent()
+    registry = AgentRegistry({"slow": agent})
+    app.dependency_overrides[get_agent_registry] = lambda: registry
+    yield agent
+    app.dependency_overrides.clear()
+
+
+async def call_until_disconnect(path: str, agent: SlowAgent) -> List[Dict[str, object]]:
+    """Drive the ASGI app directly; the client leaves once the agent is running."""
+
+    body = json.dumps({"agent_id": "slow", "message": "hi"}).encode("utf-8")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("ascii"),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent: List[Dict[str, object]] = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await agent.started.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    await asyncio.wait_for(app(scope, receive, send), timeout=5)
+    return sent
+
+
+def test_chat_disconnect_cancels_agent_and_deadline(agent):
+    disconnects = metrics.value(CLIENT_DISCONNECTS)
+
+    sent = asyncio.run(call_until_disconnect("/api/chat", agent))
+
+    assert sent[0]["status"] == 499
+    assert agent.cancelled
+    assert agent.deadline is not None and agent.deadline.cancelled
+    assert metrics.value(CLIENT_DISCONNECTS) == disconnects + 1
+
+
+def test_stream_disconnect_cancels_agent_and_deadline(agent):
+    disconnects = metrics.value(CLIENT_DISCONNECTS)
+
+    sent = asyncio.run(call_until_disconnect("/api/chat/stream", agent))
+
+    assert sent[0]["status"] == 200
+    bodies = b"".join(message.get("body", b"") for message in sent[1:])
+    assert json.loads(bodies.splitlines()[0]) == {"type": "token", "content": "first"}
+    assert agent.cancelled
+    assert agent.deadline is not None and agent.deadline.cancelled
+    assert metrics.value(CLIENT_DISCONNECTS) == disconnects + 1
+
+
+def slow_ollama(llm_service_factory):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(30)
+        return httpx.Response(200, json={"response": "late"})
+
+    return llm_service_factory(handler)
+
+
+def test_llm_deadline_records_wasted_seconds(llm_service_factory):
+    service = slow_ollama(llm_service_factory)
+    wasted = metrics.value(LLM_WASTED_SECONDS)
+
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(service.complete("hi", deadline=Deadline.after(0.05)))
+
+    assert metrics.value(LLM_WASTED_SECONDS) >= wasted + 0.05
+
+
+def test_cancelled_generation_records_wasted_seconds(llm_service_factory):
+    service = slow_ollama(llm_service_factory)
+    wasted = metrics.value(LLM_WASTED_SECONDS)
+
+    async def cancel_midway():
+        task = asyncio.ensure_future(service.complete("hi"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_midway())
+
+    assert metrics.value(LLM_WASTED_SECONDS) >= wasted + 0.05
@@ -0,0 +1,53 @@
+import threading
+
+import pytest
+
+from backend.app.core import deadline as deadline_module
+from backend.app.core.deadline import Deadline, DeadlineExceeded
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(deadline_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_unbounded_deadline_never_expires(clock):
+    deadline = Deadline.after(None)
+
+    clock[0] += 1e6
+    assert deadline.remaining() is None
+    assert deadline.timeout(30.0) == 30.0
+    deadline.check()
+
+
+def test_timeout_is_clamped_to_remaining_time(clock):
+    deadline = Deadline.after(10)
+
+    clock[0] += 4
+    assert deadline.remaining() == pytest.approx(6)
+    assert deadline.timeout(30.0) == pytest.approx(6)
+    assert deadline.timeout(2.0) == 2.0
+
+
+def test_check_raises_once_expired(clock):
+    deadline = Deadline.after(1)
+    deadline.check()
+
+    clock[0] += 1
+    assert deadline.expired
+    assert deadline.remaining() == 0.0
+    with pytest.raises(DeadlineExceeded, match="deadline exceeded"):
+        deadline.check()
+
+
+def test_cancel_is_visible_from_other_threads():
+    deadline = Deadline.after(None)
+    worker = threading.Thread(target=deadline.cancel)
+    worker.start()
+    worker.join()
+
+    assert deadline.cancelled and deadline.expired
+    with pytest.raises(DeadlineExceeded, match="cancelled"):
+        deadline.check()
@@ -0,0 +1,120 @@
+import base64
+import hashlib
+from typing import List, Optional
+
+import pytest
+
+from backend.app.core.deadline import Deadline, DeadlineExceeded
+from backend.app.services.ocr_service import OCRService
+
+pytest.importorskip("pypdf")
+
+INVOICE_TEXT = "Invoice 2024-001 Total due 1234 EUR"
+
+
+# AES-256 security handler; the key material is junk, which is enough to make
+# pypdf run (or, without ``cryptography``, fail to run) the AES password check.
+AES_256_ENCRYPT = (
+    b" /Encrypt << /Filter /Standard /V 5 /R 6 /Length 256 /P -4"
+    b" /O <%s> /U <%s> /OE <%s> /UE <%s> /Perms <%s>"
+    b" /CF << /StdCF << /CFM /AESV3 /AuthEvent /DocOpen /Length 32 >> >>"
+    b" /StmF /StdCF /StrF /StdCF >>"
+    b" /ID [<00112233445566778899aabbccddeeff> <00112233445566778899aabbccddeeff>]"
+) % (b"00" * 48, b"00" * 48, b"00" * 32, b"00" * 32, b"00" * 16)
+
+
+def build_pdf(page_texts: List[Optional[str]], trailer: bytes = b"") -> bytes:
+    """Assemble a minimal PDF; ``None`` pages have no content stream."""
+
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", b""]
+    font_id = 3
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    page_ids = []
+    for text in page_texts:
+        page = b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792]"
+        page += b" /Resources << /Font << /F1 %d 0 R >> >>" % font_id
+        if text is not None:
+            stream = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text.encode("latin-1")
+            objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+            page += b" /Contents %d 0 R" % len(objects)
+        objects.append(page + b" >>")
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    output = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R%s >>\n" % (len(objects) + 1, trailer)
+    output += b"startxref\n%d\n%%%%EOF\n" % xref
+    return output
+
+
+def test_text_layer_is_used_and_blank_pages_are_ocred():
+    pages = OCRService()._extract_pdf(build_pdf([INVOICE_TEXT, None, "12"]), None)
+
+    assert [(page.page_number, page.method) for page in pages] == [
+        (1, "text_layer"),
+        (2, "ocr"),
+        (3, "ocr"),
+    ]
+    assert INVOICE_TEXT in pages[0].text
+    assert pages[1].text.endswith("(page 2)")
+
+
+def test_malformed_pdf_is_ocred_whole():
+    pages = OCRService()._extract_pdf(b"%PDF-1.4 not really a pdf", None)
+
+    assert [(page.page_number, page.method) for page in pages] == [(1, "ocr")]
+
+
+def test_aes_encrypted_pdf_is_ocred_whole():
+    pages = OCRService()._extract_pdf(build_pdf([INVOICE_TEXT], AES_256_ENCRYPT), None)
+
+    assert [(page.page_number, page.method) for page in pages] == [(1, "ocr")]
+
+
+def test_cancellation_stops_mid_document():
+    deadline = Deadline()
+    processed = []
+
+    class CancellingOCRService(OCRService):
+        def _ocr_pdf_page(self, content, page_number):
+            processed.append(page_number)
+            deadline.cancel()  # The client disconnects while page 1 is OCRed.
+            return super()._ocr_pdf_page(content, page_number)
+
+    with pytest.raises(DeadlineExceeded, match="cancelled"):
+        CancellingOCRService()._extract_pdf(build_pdf([None, None, None]), deadline)
+
+    assert processed == [1]
+
+
+def test_extraction_stops_at_deadline():
+    deadline = Deadline()
+    deadline.cancel()
+
+    with pytest.raises(DeadlineExceeded):
+        OCRService()._extract_pdf(build_pdf([INVOICE_TEXT]), deadline)
+
+
+def test_document_digest_covers_the_bytes_read():
+    content = build_pdf([INVOICE_TEXT])
+    public = build_pdf(["Public handbook with enough text to use"])
+    attachment = {
+        "name": "a.pdf",
+        "content_type": "application/pdf",
+        "data": base64.b64encode(content).decode("ascii"),
+        # A client-supplied id must not let other bytes claim its cache scope.
+        "id": hashlib.sha256(public).hexdigest(),
+    }
+
+    (document,) = OCRService().extract_documents([attachment])
+
+    assert document.digest == hashlib.sha256(content).hexdigest()
+    assert document.pages[0].method == "text_layer"
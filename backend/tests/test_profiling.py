@@ -0,0 +1,140 @@
+import cProfile
+import os
+import pstats
+import threading
+from collections import Counter
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.api import debug
+from backend.app.core.config import settings
+from backend.app.core.profiling import (
+    ProfileStore,
+    ProfilingMiddleware,
+    is_admin,
+    render_collapsed,
+    sample_stacks,
+)
+from backend.app.main import create_app
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+def busy_function():
+    return sum(range(10_000))
+
+
+def profiled(store, profile_id):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    busy_function()
+    profiler.disable()
+    store.save(profile_id, profiler)
+
+
+def test_is_admin_requires_a_configured_token():
+    assert is_admin("secret", "secret")
+    assert not is_admin("wrong", "secret")
+    assert not is_admin(None, "secret")
+    assert not is_admin("", None)
+
+
+def test_profile_dump_loads_with_pstats(tmp_path):
+    store = ProfileStore()
+    profiled(store, "p1")
+    path = tmp_path / "p1.pstats"
+    path.write_bytes(store.dump("p1"))
+
+    functions = {name for _, _, name in pstats.Stats(str(path)).stats}
+
+    assert "busy_function" in functions
+    assert "busy_function" in store.render("p1")
+    assert store.dump("missing") is None and store.render("missing") is None
+
+
+def test_store_keeps_only_the_latest_profiles():
+    store = ProfileStore(max_profiles=2)
+    for profile_id in ("p1", "p2", "p3"):
+        profiled(store, profile_id)
+
+    assert store.dump("p1") is None
+    assert store.dump("p2") is not None and store.dump("p3") is not None
+
+
+def spin_until(stop: threading.Event) -> None:
+    while not stop.is_set():
+        busy_function()
+
+
+def test_sample_stacks_covers_other_threads():
+    stop = threading.Event()
+    worker = threading.Thread(target=spin_until, args=(stop,), name="spinner")
+    worker.start()
+    try:
+        counts = sample_stacks(0.1, interval=0.005)
+    finally:
+        stop.set()
+        worker.join()
+
+    stacks = [stack for stack in counts if stack.startswith("spinner;")]
+    assert stacks and all("spin_until (test_profiling.py)" in stack for stack in stacks)
+    assert not any("sample_stacks" in stack for stack in counts)
+
+
+def test_render_collapsed_orders_by_count():
+    counts = Counter({"main;a": 1, "main;b": 3})
+
+    assert render_collapsed(counts) == "main;b 3\nmain;a 1\n"
+
+
+@pytest.fixture
+def enabled_client(monkeypatch):
+    monkeypatch.setattr(settings, "profiling_enabled", True)
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    return TestClient(create_app())
+
+
+def test_profiling_is_not_mounted_by_default(monkeypatch):
+    monkeypatch.setattr(settings, "profiling_enabled", False)
+    app = create_app()
+    client = TestClient(app)
+
+    assert all(middleware.cls is not ProfilingMiddleware for middleware in app.user_middleware)
+    assert client.get("/debug/profile", headers=ADMIN).status_code == 404
+    response = client.get("/api/metrics", headers={"X-Profile": "1", **ADMIN})
+    assert "x-profile-id" not in response.headers
+
+
+def test_debug_routes_require_the_admin_token(enabled_client):
+    assert enabled_client.get("/debug/profile").status_code == 403
+    wrong = enabled_client.get("/debug/profile", headers={"X-Admin-Token": "x"})
+    assert wrong.status_code == 403
+    assert enabled_client.get("/debug/profiles/abc").status_code == 403
+
+
+def test_requests_are_only_profiled_for_admins(enabled_client, tmp_path):
+    anonymous = enabled_client.get("/api/metrics", headers={"X-Profile": "1"})
+    assert "x-profile-id" not in anonymous.headers
+
+    response = enabled_client.get("/api/metrics", headers={"X-Profile": "1", **ADMIN})
+    profile_id = response.headers["x-profile-id"]
+
+    dump = enabled_client.get(f"/debug/profiles/{profile_id}", headers=ADMIN)
+    path = tmp_path / "request.pstats"
+    path.write_bytes(dump.content)
+    assert pstats.Stats(str(path)).total_calls > 0
+
+    text = enabled_client.get(f"/debug/profiles/{profile_id}?format=text", headers=ADMIN)
+    assert "function calls" in text.text
+    missing = enabled_client.get("/debug/profiles/unknown", headers=ADMIN)
+    assert missing.status_code == 404
+
+
+def test_sampling_endpoint_names_the_worker(enabled_client):
+    response = enabled_client.get(
+        "/debug/profile", params={"seconds": 0.05, "interval_ms": 5}, headers=ADMIN
+    )
+
+    assert response.status_code == 200
+    assert response.headers[debug.WORKER_PID_HEADER] == str(os.getpid())
@@ -0,0 +1,109 @@
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.main import app
+from backend.app.services.agent_registry import build_registry, get_agent_registry
+from backend.app.services.device_ops_service import DeviceOpsService
+from backend.app.services.ocr_service import OCRService
+from backend.app.services.prompt_service import PromptService
+from backend.app.services.session_store import SessionStore, get_session_store
+
+from .conftest import ollama_stream
+
+
+def ollama(request: httpx.Request) -> httpx.Response:
+    if json.loads(request.content)["stream"]:
+        return ollama_stream(["Fan", " is fine"])
+    return httpx.Response(200, json={"response": "Fan is fine"})
+
+
+@pytest.fixture
+def sessions():
+    return SessionStore()
+
+
+@pytest.fixture
+def client(sessions, llm_service_factory):
+    registry = build_registry(
+        OCRService(), DeviceOpsService(), PromptService(), llm_service_factory(ollama)
+    )
+    app.dependency_overrides[get_agent_registry] = lambda: registry
+    app.dependency_overrides[get_session_store] = lambda: sessions
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("path", ["/api/chat", "/api/chat/stream"])
+@pytest.mark.parametrize("timeout", ["-5", "0"])
+def test_non_positive_timeout_header_is_rejected(client, path, timeout):
+    response = client.post(
+        path,
+        json={"agent_id": "ocr", "message": "hi"},
+        headers={"X-Request-Timeout": timeout},
+    )
+
+    assert response.status_code == 422
+
+
+def test_chat_returns_context_by_default(client):
+    response = client.post("/api/chat", json={"agent_id": "device_ops", "message": "ok?"})
+
+    body = response.json()
+    assert body["response"] == "Fan is fine"
+    assert [entry["role"] for entry in body["context"]["conversation_history"]] == [
+        "user",
+        "agent",
+    ]
+
+
+def test_session_context_is_merged_and_stored(client, sessions):
+    sessions.save("s1", {"telemetry": {"temperature": "70C"}, "site": "berlin"})
+
+    response = client.post(
+        "/api/chat",
+        json={
+            "agent_id": "device_ops",
+            "message": "ok?",
+            "session_id": "s1",
+            "context": {"telemetry": {"temperature": "91C"}},
+            "return_context": False,
+        },
+    )
+
+    assert response.json()["context"] == {}
+    assert response.json()["session_id"] == "s1"
+    stored = sessions.load("s1")
+    assert stored["telemetry"] == {"temperature": "91C"}
+    assert stored["site"] == "berlin"
+    assert len(stored["conversation_history"]) == 2
+
+
+def test_stream_emits_tokens_then_done(client, sessions):
+    response = client.post(
+        "/api/chat/stream",
+        json={"agent_id": "device_ops", "message": "ok?", "session_id": "s1"},
+    )
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert events[:2] == [
+        {"type": "token", "content": "Fan"},
+        {"type": "token", "content": " is fine"},
+    ]
+    assert events[2]["type"] == "done"
+    assert events[2]["response"] == "Fan is fine"
+    assert len(sessions.load("s1")["conversation_history"]) == 2
+
+
+def test_stream_reports_provider_failure_as_error_event(client, llm_service_factory):
+    failing = llm_service_factory(lambda request: httpx.Response(500))
+    registry = build_registry(OCRService(), DeviceOpsService(), PromptService(), failing)
+    app.dependency_overrides[get_agent_registry] = lambda: registry
+
+    response = client.post("/api/chat/stream", json={"agent_id": "ocr", "message": "hi"})
+
+    (event,) = [json.loads(line) for line in response.text.splitlines()]
+    assert (event["type"], event["status_code"]) == ("error", 502)
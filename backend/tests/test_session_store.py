@@ -0,0 +1,45 @@
+from backend.app.services import session_store
+from backend.app.services.session_store import SessionStore
+
+
+def test_load_returns_copy_of_saved_context():
+    store = SessionStore()
+    store.save("s1", {"telemetry": {"temperature": "70C"}})
+
+    context = store.load("s1")
+    context["extra"] = True
+
+    assert store.load("s1") == {"telemetry": {"temperature": "70C"}}
+    assert store.load("unknown") == {}
+
+
+def test_expired_sessions_are_dropped(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(session_store.time, "monotonic", lambda: now[0])
+    store = SessionStore(ttl_seconds=10)
+    store.save("s1", {"a": 1})
+
+    now[0] += 5
+    assert store.load("s1") == {"a": 1}
+    now[0] += 11
+    assert store.load("s1") == {}
+
+
+def test_least_recently_used_session_is_evicted():
+    store = SessionStore(max_sessions=2)
+    store.save("s1", {"n": 1})
+    store.save("s2", {"n": 2})
+    store.load("s1")
+    store.save("s3", {"n": 3})
+
+    assert store.load("s1") == {"n": 1}
+    assert store.load("s2") == {}
+    assert store.load("s3") == {"n": 3}
+
+
+def test_delete():
+    store = SessionStore()
+    store.save("s1", {})
+
+    assert store.delete("s1") is True
+    assert store.delete("s1") is False
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.main import app
+from backend.app.services.agent_registry import build_registry, get_agent_registry
+from backend.app.services.device_ops_service import DeviceOpsService
+from backend.app.services.ocr_service import OCRService
+from backend.app.services.prompt_service import PromptService
+from backend.app.services.session_store import SessionStore, get_session_store
+
+from .conftest import ollama_stream
+
+
+class FakeOllama:
+    """Mock ``/api/generate`` whose streams can be held open by the test."""
+
+    def __init__(self) -> None:
+        self.status_code = 200
+        self.hold = False
+        self.released = threading.Event()
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, json={"error": "model crashed"})
+        if not self.hold:
+            return ollama_stream(["Hello", " world"])
+
+        async def held_stream():
+            yield json.dumps({"response": "partial", "done": False}).encode() + b"\n"
+            while not self.released.is_set():
+                await asyncio.sleep(0.01)
+            yield json.dumps({"response": "", "done": True}).encode() + b"\n"
+
+        return httpx.Response(200, content=held_stream())
+
+
+@pytest.fixture
+def ollama():
+    return FakeOllama()
+
+
+@pytest.fixture
+def sessions():
+    return SessionStore()
+
+
+@pytest.fixture
+def client(ollama, sessions, llm_service_factory):
+    registry = build_registry(
+        OCRService(), DeviceOpsService(), PromptService(), llm_service_factory(ollama)
+    )
+    app.dependency_overrides[get_agent_registry] = lambda: registry
+    app.dependency_overrides[get_session_store] = lambda: sessions
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def receive_until(socket, kind):
+    events = []
+    while True:
+        event = socket.receive_json()
+        events.append(event)
+        if event["type"] == kind:
+            return events
+
+
+def sync(socket):
+    """Round-trip a bad frame so every earlier frame is known to be processed."""
+
+    socket.send_json({"type": "sync"})
+    assert socket.receive_json()["status_code"] == 400
+
+
+def test_turn_streams_tokens_then_done(client):
+    with client.websocket_connect("/api/ws/chat") as socket:
+        socket.send_json({"type": "message", "id": "t1", "message": "hi"})
+        events = receive_until(socket, "done")
+
+    assert [event["content"] for event in events[:-1]] == ["Hello", " world"]
+    assert events[-1] == {"type": "done", "id": "t1", "response": "Hello world"}
+
+
+def test_cancel_stops_the_running_turn(client, ollama):
+    ollama.hold = True
+    with client.websocket_connect("/api/ws/chat") as socket:
+        socket.send_json({"type": "message", "id": "t1", "message": "hi"})
+        assert socket.receive_json() == {"type": "token", "id": "t1", "content": "partial"}
+
+        socket.send_json({"type": "message", "id": "t2", "message": "again"})
+        assert socket.receive_json()["status_code"] == 409
+
+        socket.send_json({"type": "cancel", "id": "t1"})
+        assert socket.receive_json() == {"type": "cancelled", "id": "t1"}
+
+        ollama.hold = False
+        socket.send_json({"type": "message", "id": "t3", "message": "again"})
+        assert receive_until(socket, "done")[-1]["id"] == "t3"
+
+
+def test_provider_failure_is_reported_and_connection_survives(client, ollama):
+    ollama.status_code = 500
+    with client.websocket_connect("/api/ws/chat") as socket:
+        socket.send_json({"type": "message", "id": "t1", "message": "hi"})
+        error = socket.receive_json()
+        assert (error["type"], error["id"], error["status_code"]) == ("error", "t1", 502)
+
+        socket.send_json({"type": "message", "id": "t2", "message": "hi", "agent_id": "nope"})
+        assert socket.receive_json()["status_code"] == 404
+
+        socket.send_json({"type": "message", "id": "t3"})
+        assert socket.receive_json()["status_code"] == 422
+
+        ollama.status_code = 200
+        socket.send_json({"type": "message", "id": "t4", "message": "hi"})
+        assert receive_until(socket, "done")[-1]["response"] == "Hello world"
+
+
+def test_binary_frames_are_rejected_without_closing(client):
+    with client.websocket_connect("/api/ws/chat") as socket:
+        socket.send_bytes(b"{}")
+        error = socket.receive_json()
+        assert (error["type"], error["status_code"]) == ("error", 400)
+
+        socket.send_json({"type": "message", "id": "t1", "message": "hi"})
+        assert receive_until(socket, "done")[-1]["id"] == "t1"
+
+
+def test_telemetry_received_mid_turn_is_kept(client, ollama, sessions):
+    ollama.hold = True
+    with client.websocket_connect("/api/ws/chat?agent_id=device_ops&session_id=s1") as socket:
+        socket.send_json({"type": "telemetry", "telemetry": {"temperature": "70C"}})
+        socket.send_json({"type": "message", "id": "t1", "message": "status?"})
+        assert socket.receive_json()["type"] == "token"
+
+        socket.send_json({"type": "telemetry", "telemetry": {"fan": "stopped"}})
+        sync(socket)
+        ollama.released.set()
+        assert receive_until(socket, "done")[-1]["id"] == "t1"
+
+    context = sessions.load("s1")
+    assert context["telemetry"] == {"temperature": "70C", "fan": "stopped"}
+    assert len(context["conversation_history"]) == 2
+
+
+def test_reset_clears_session(client, sessions):
+    with client.websocket_connect("/api/ws/chat?session_id=s1") as socket:
+        socket.send_json({"type": "message", "id": "t1", "message": "hi"})
+        receive_until(socket, "done")
+        assert sessions.load("s1")
+
+        socket.send_json({"type": "reset"})
+        sync(socket)
+
+    assert sessions.load("s1") == {}
@@ -0,0 +1,21 @@
+"""Official Python client for the AgenticAI backend."""
+
+from .async_client import AsyncAgenticClient, AsyncChatSession, AsyncChatStream
+from .client import AgenticClient, ChatSession, ChatStream
+from .errors import AgenticClientError, APIError
+from .models import AttachmentHandle, ChatResult, ChatTurn, RetryPolicy
+
+__all__ = [
+    "AgenticClient",
+    "AgenticClientError",
+    "APIError",
+    "AsyncAgenticClient",
+    "AsyncChatSession",
+    "AsyncChatStream",
+    "AttachmentHandle",
+    "ChatResult",
+    "ChatSession",
+    "ChatStream",
+    "ChatTurn",
+    "RetryPolicy",
+]
@@ -0,0 +1,189 @@
+"""Helpers shared by the sync and async clients."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mimetypes
+import threading
+import time
+from pathlib import Path
+from typing import IO, Dict, Mapping, Optional, Sequence, Tuple, Union
+
+import httpx
+
+from .errors import APIError
+from .models import AttachmentHandle, ChatResult
+
+DEFAULT_BASE_URL = "http://localhost:8000"
+# The backend deletes attachments idle for 24 hours by default; re-upload well
+# before that so long-lived clients never hand out a pruned id.
+DEFAULT_UPLOAD_CACHE_TTL = 3600.0
+# Statuses the backend (or a proxy) sends without having processed the request.
+_REFUSED_STATUSES = frozenset({429, 503})
+
+UploadSource = Union[bytes, str, Path, IO[bytes]]
+
+
+def build_chat_payload(
+    agent_id: str,
+    message: str,
+    session_id: Optional[str],
+    context: Optional[Mapping[str, object]],
+    attachments: Sequence[AttachmentHandle],
+    return_context: Optional[bool],
+    deadline: Optional[float] = None,
+) -> Dict[str, object]:
+    payload: Dict[str, object] = {"agent_id": agent_id, "message": message}
+    if deadline is not None:
+        # Total time budget for the turn, unlike httpx's per-read timeout.
+        payload["timeout"] = deadline
+    if session_id:
+        payload["session_id"] = session_id
+    if context:
+        payload["context"] = dict(context)
+    if attachments:
+        payload["attachments"] = [handle.as_reference() for handle in attachments]
+    # Session-backed turns keep context on the server, so skip echoing it back
+    # unless the caller asks for it explicitly.
+    payload["return_context"] = (
+        return_context if return_context is not None else not session_id
+    )
+    return payload
+
+
+def parse_chat_result(data: Mapping[str, object]) -> ChatResult:
+    context = data.get("context")
+    return ChatResult(
+        agent_id=str(data.get("agent_id", "")),
+        response=str(data.get("response", "")),
+        context=dict(context) if isinstance(context, Mapping) else {},
+        session_id=data.get("session_id") or None,  # type: ignore[arg-type]
+    )
+
+
+def parse_stream_event(line: str) -> Tuple[Optional[str], Optional[ChatResult]]:
+    """Decode one NDJSON line into either a token or the final result."""
+
+    if not line.strip():
+        return None, None
+    event = json.loads(line)
+    kind = event.get("type")
+    if kind == "token":
+        return str(event.get("content", "")), None
+    if kind == "done":
+        return None, parse_chat_result(event)
+    if kind == "error":
+        raise APIError(int(event.get("status_code", 500)), str(event.get("detail", "")))
+    return None, None
+
+
+def is_retryable_error(method: str, exc: httpx.TransportError) -> bool:
+    """Whether resending is safe after ``exc``.
+
+    POSTs run agent turns and store uploads, so they are only retried when the
+    request provably never reached the server.
+    """
+
+    if method.upper() != "POST":
+        return True
+    return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+def is_retryable_status(method: str, status_code: int, retry_statuses: frozenset) -> bool:
+    """Whether a response with ``status_code`` may be retried.
+
+    A 502 can come from a proxy after the backend already ran the turn, so
+    POSTs are only retried on statuses meaning the request was refused.
+    """
+
+    if status_code not in retry_statuses:
+        return False
+    return method.upper() != "POST" or status_code in _REFUSED_STATUSES
+
+
+def retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds requested by a ``Retry-After`` header, if given as a number."""
+
+    try:
+        return max(0.0, float(response.headers["retry-after"]))
+    except (KeyError, ValueError):
+        return None
+
+
+def raise_for_status(response: httpx.Response) -> None:
+    if response.is_success:
+        return
+    try:
+        detail = str(response.json().get("detail", response.text))
+    except (ValueError, AttributeError):
+        detail = response.text
+    raise APIError(response.status_code, detail)
+
+
+def read_upload_source(
+    source: UploadSource,
+    name: Optional[str],
+    content_type: Optional[str],
+) -> Tuple[bytes, str, Optional[str]]:
+    """Normalise bytes, paths and file objects into ``(content, name, type)``."""
+
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        content = path.read_bytes()
+        name = name or path.name
+    elif isinstance(source, (bytes, bytearray)):
+        content = bytes(source)
+    else:
+        content = source.read()
+        name = name or Path(str(getattr(source, "name", ""))).name
+        content_type = content_type or getattr(source, "type", None)
+    name = name or "attachment"
+    if content_type is None:
+        content_type = mimetypes.guess_type(name)[0]
+    return content, name, content_type
+
+
+def content_digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class UploadCache:
+    """Content digest to attachment handle map shared by both clients.
+
+    Entries expire after ``ttl_seconds`` and are dropped as soon as the backend
+    reports an attachment missing, so the next ``upload`` sends the bytes again.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_UPLOAD_CACHE_TTL) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[AttachmentHandle, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> Optional[AttachmentHandle]:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            handle, stored_at = entry
+            if time.monotonic() - stored_at >= self._ttl_seconds:
+                del self._entries[digest]
+                return None
+            return handle
+
+    def put(self, digest: str, handle: AttachmentHandle) -> None:
+        with self._lock:
+            self._entries[digest] = (handle, time.monotonic())
+
+    def forget_missing(
+        self, exc: APIError, attachments: Sequence[AttachmentHandle]
+    ) -> None:
+        """Drop handles used by a turn the backend rejected with 404."""
+
+        if exc.status_code != 404 or not attachments:
+            return
+        stale = {handle.id for handle in attachments}
+        with self._lock:
+            for digest, (handle, _) in list(self._entries.items()):
+                if handle.id in stale:
+                    del self._entries[digest]
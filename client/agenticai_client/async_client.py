@@ -0,0 +1,278 @@
+"""Asynchronous client for the AgenticAI backend."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from dataclasses import replace
+from typing import AsyncIterator, Iterable, List, Mapping, Optional, Sequence
+
+import httpx
+
+from ._common import (
+    DEFAULT_BASE_URL,
+    DEFAULT_UPLOAD_CACHE_TTL,
+    UploadCache,
+    UploadSource,
+    build_chat_payload,
+    content_digest,
+    is_retryable_error,
+    is_retryable_status,
+    parse_chat_result,
+    parse_stream_event,
+    raise_for_status,
+    read_upload_source,
+    retry_after,
+)
+from .errors import AgenticClientError, APIError
+from .models import AttachmentHandle, ChatResult, ChatTurn, RetryPolicy
+
+
+class AsyncAgenticClient:
+    """``asyncio`` counterpart of ``AgenticClient`` sharing one connection pool.
+
+    As in the sync client, ``timeout`` is per network read and ``deadline``
+    caps the total duration of a turn.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        *,
+        timeout: float = 60.0,
+        retry: Optional[RetryPolicy] = None,
+        max_connections: int = 20,
+        upload_cache_ttl: float = DEFAULT_UPLOAD_CACHE_TTL,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+        self._retry = retry or RetryPolicy()
+        self._uploads = UploadCache(upload_cache_ttl)
+
+    async def __aenter__(self) -> "AsyncAgenticClient":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def upload(
+        self,
+        source: UploadSource,
+        *,
+        name: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> AttachmentHandle:
+        """Upload an attachment once and return a handle usable on any turn."""
+
+        content, name, content_type = read_upload_source(source, name, content_type)
+        digest = content_digest(content)
+        cached = self._uploads.get(digest)
+        if cached is not None:
+            return replace(cached, name=name, content_type=content_type)
+
+        response = await self._send(
+            "POST",
+            "/api/attachments",
+            params={"name": name, **({"content_type": content_type} if content_type else {})},
+            content=content,
+            headers={"Content-Type": "application/octet-stream"},
+        )
+        data = response.json()
+        handle = AttachmentHandle(
+            id=str(data["id"]),
+            name=name,
+            content_type=content_type,
+            size=int(data.get("size", len(content))),
+        )
+        self._uploads.put(digest, handle)
+        return handle
+
+    async def chat(
+        self,
+        agent_id: str,
+        message: str,
+        *,
+        session_id: Optional[str] = None,
+        context: Optional[Mapping[str, object]] = None,
+        attachments: Sequence[AttachmentHandle] = (),
+        return_context: Optional[bool] = None,
+        deadline: Optional[float] = None,
+    ) -> ChatResult:
+        payload = build_chat_payload(
+            agent_id, message, session_id, context, attachments, return_context, deadline
+        )
+        try:
+            response = await self._send("POST", "/api/chat", json=payload)
+        except APIError as exc:
+            self._uploads.forget_missing(exc, attachments)
+            raise
+        return parse_chat_result(response.json())
+
+    async def stream_chat(
+        self,
+        agent_id: str,
+        message: str,
+        *,
+        session_id: Optional[str] = None,
+        context: Optional[Mapping[str, object]] = None,
+        attachments: Sequence[AttachmentHandle] = (),
+        return_context: Optional[bool] = None,
+        deadline: Optional[float] = None,
+    ) -> "AsyncChatStream":
+        """Start a streaming turn; iterate the result to receive tokens."""
+
+        payload = build_chat_payload(
+            agent_id, message, session_id, context, attachments, return_context, deadline
+        )
+        try:
+            response = await self._send("POST", "/api/chat/stream", json=payload, stream=True)
+        except APIError as exc:
+            self._uploads.forget_missing(exc, attachments)
+            raise
+        return AsyncChatStream(response)
+
+    async def chat_many(
+        self, turns: Iterable[ChatTurn], *, max_concurrency: int = 4
+    ) -> List[ChatResult]:
+        """Run independent turns concurrently, returning results in input order."""
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(turn: ChatTurn) -> ChatResult:
+            async with semaphore:
+                return await self.chat(
+                    turn.agent_id,
+                    turn.message,
+                    session_id=turn.session_id,
+                    context=turn.context,
+                    attachments=turn.attachments,
+                    deadline=turn.deadline,
+                )
+
+        return list(await asyncio.gather(*(run(turn) for turn in turns)))
+
+    def session(
+        self, agent_id: str, session_id: Optional[str] = None
+    ) -> "AsyncChatSession":
+        return AsyncChatSession(self, agent_id, session_id or uuid.uuid4().hex)
+
+    async def delete_session(self, session_id: str) -> None:
+        await self._send("DELETE", f"/api/sessions/{session_id}")
+
+    async def _send(
+        self, method: str, url: str, *, stream: bool = False, **kwargs: object
+    ) -> httpx.Response:
+        attempt = 1
+        while True:
+            wait: Optional[float] = None
+            request = self._client.build_request(method, url, **kwargs)  # type: ignore[arg-type]
+            try:
+                response = await self._client.send(request, stream=stream)
+            except httpx.TransportError as exc:
+                if attempt >= self._retry.max_attempts or not is_retryable_error(method, exc):
+                    raise AgenticClientError(f"Failed to contact backend: {exc}") from exc
+            else:
+                if attempt >= self._retry.max_attempts or not is_retryable_status(
+                    method, response.status_code, self._retry.retry_statuses
+                ):
+                    if not response.is_success:
+                        if stream:
+                            await response.aread()
+                            await response.aclose()
+                        raise_for_status(response)
+                    return response
+                wait = retry_after(response)
+                await response.aclose()
+            await asyncio.sleep(self._retry.delay(attempt, wait))
+            attempt += 1
+
+
+class AsyncChatStream:
+    """Async iterator over streamed tokens; ``result`` is set once it ends."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+        self.result: Optional[ChatResult] = None
+
+    async def __aenter__(self) -> "AsyncChatStream":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        try:
+            async for line in self._response.aiter_lines():
+                token, result = parse_stream_event(line)
+                if token:
+                    yield token
+                if result is not None:
+                    self.result = result
+        except httpx.HTTPError as exc:
+            raise AgenticClientError(f"Stream interrupted: {exc}") from exc
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._response.aclose()
+
+
+class AsyncChatSession:
+    """Conversation whose context is kept on the server under ``session_id``."""
+
+    def __init__(
+        self, client: AsyncAgenticClient, agent_id: str, session_id: str
+    ) -> None:
+        self.client = client
+        self.agent_id = agent_id
+        self.session_id = session_id
+
+    async def send(
+        self,
+        message: str,
+        *,
+        context: Optional[Mapping[str, object]] = None,
+        attachments: Sequence[AttachmentHandle] = (),
+        deadline: Optional[float] = None,
+    ) -> ChatResult:
+        return await self.client.chat(
+            self.agent_id,
+            message,
+            session_id=self.session_id,
+            context=context,
+            attachments=attachments,
+            deadline=deadline,
+        )
+
+    async def stream(
+        self,
+        message: str,
+        *,
+        context: Optional[Mapping[str, object]] = None,
+        attachments: Sequence[AttachmentHandle] = (),
+        deadline: Optional[float] = None,
+    ) -> AsyncChatStream:
+        return await self.client.stream_chat(
+            self.agent_id,
+            message,
+            session_id=self.session_id,
+            context=context,
+            attachments=attachments,
+            deadline=deadline,
+        )
+
+    async def reset(self) -> None:
+        """Drop the server-side context for this session."""
+
+        await self.client.delete_session(self.session_id)
@@ -0,0 +1,275 @@
+"""Synchronous client for the AgenticAI backend."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Iterable, Iterator, List, Mapping, Optional, Sequence
+
+import httpx
+
+from ._common import (
+    DEFAULT_BASE_URL,
+    DEFAULT_UPLOAD_CACHE_TTL,
+    UploadCache,
+    UploadSource,
+    build_chat_payload,
+    content_digest,
+    is_retryable_error,
+    is_retryable_status,
+    parse_chat_result,
+    parse_stream_event,
+    raise_for_status,
+    read_upload_source,
+    retry_after,
+)
+from .errors import AgenticClientError, APIError
+from .models import AttachmentHandle, ChatResult, ChatTurn, RetryPolicy
+
+
+class AgenticClient:
+    """Thread-safe client that keeps a pool of keep-alive connections.
+
+    Create one instance per process and reuse it; every call shares the same
+    connection pool and the upload cache. ``timeout`` only bounds each network
+    read, so long streams keep going while tokens arrive; pass ``deadline`` to
+    a turn to cap its total duration on the server.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        *,
+        timeout: float = 60.0,
+        retry: Optional[RetryPolicy] = None,
+        max_connections: int = 20,
+        upload_cache_ttl: float = DEFAULT_UPLOAD_CACHE_TTL,
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
+        self._client = httpx.Client(
+            base_url=base_url.rstrip("/"),
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+        self._retry = retry or RetryPolicy()
+        self._uploads = UploadCache(upload_cache_ttl)
+
+    def __enter__(self) -> "AgenticClient":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._client.close()
+
+    def upload(
+        self,
+        source: UploadSource,
+        *,
+        name: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> AttachmentHandle:
+        """Upload an attachment once and return a handle usable on any turn."""
+
+        content, name, content_type = read_upload_source(source, name, content_type)
+        digest = content_digest(content)
+        cached = self._uploads.get(digest)
+        if cached is not None:
+            return replace(cached, name=name, content_type=content_type)
+
+        response = self._send(
+            "POST",
+            "/api/attachments",
+            params={"name": name, **({"content_type": content_type} if content_type else {})},
+            content=content,
+            headers={"Content-Type": "application/octet-stream"},
+        )
+        data = response.json()
+        handle = AttachmentHandle(
+            id=str(data["id"]),
+            name=name,
+            content_type=content_type,
+            size=int(data.get("size", len(content))),
+        )
+        self._uploads.put(digest, handle)
+        return handle
+
+    def chat(
+        self,
+        agent_id: str,
+        message: str,
+        *,
+        session_id: Optional[str] = None,
+        context: Optional[Mapping[str, object]] = None,
+        attachments: Sequence[AttachmentHandle] = (),
+        return_context: Optional[bool] = None,
+        deadline: Optional[float] = None,
+    ) -> ChatResult:
+        payload = build_chat_payload(
+            agent_id, message, session_id, context, attachments, return_context, deadline
+        )
+        try:
+            response = self._send("POST", "/api/chat", json=payload)
+        except APIError as exc:
+            self._uploads.forget_missing(exc, attachments)
+            raise
+        return parse_chat_result(response.json())
+
+    def stream_chat(
+        self,
+        agent_id: str,
+        message: str,
+        *,
+        session_id: Optional[str] = None,
+        context: Optional[Mapping[str, object]] = None,
+        attachments: Sequence[AttachmentHandle] = (),
+        return_context: Optional[bool] = None,
+        deadline: Optional[float] = None,
+    ) -> "ChatStream":
+        """Start a streaming turn; iterate the result to receive tokens."""
+
+        payload = build_chat_payload(
+            agent_id, message, session_id, context, attachments, return_context, deadline
+        )
+        try:
+            response = self._send("POST", "/api/chat/stream", json=payload, stream=True)
+        except APIError as exc:
+            self._uploads.forget_missing(exc, attachments)
+            raise
+        return ChatStream(response)
+
+    def chat_many(
+        self, turns: Iterable[ChatTurn], *, max_concurrency: int = 4
+    ) -> List[ChatResult]:
+        """Run independent turns concurrently, returning results in input order."""
+
+        def run(turn: ChatTurn) -> ChatResult:
+            return self.chat(
+                turn.agent_id,
+                turn.message,
+                session_id=turn.session_id,
+                context=turn.context,
+                attachments=turn.attachments,
+                deadline=turn.deadline,
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            return list(executor.map(run, turns))
+
+    def session(self, agent_id: str, session_id: Optional[str] = None) -> "ChatSession":
+        return ChatSession(self, agent_id, session_id or uuid.uuid4().hex)
+
+    def delete_session(self, session_id: str) -> None:
+        self._send("DELETE", f"/api/sessions/{session_id}")
+
+    def _send(
+        self, method: str, url: str, *, stream: bool = False, **kwargs: object
+    ) -> httpx.Response:
+        attempt = 1
+        while True:
+            wait: Optional[float] = None
+            request = self._client.build_request(method, url, **kwargs)  # type: ignore[arg-type]
+            try:
+                response = self._client.send(request, stream=stream)
+            except httpx.TransportError as exc:
+                if attempt >= self._retry.max_attempts or not is_retryable_error(method, exc):
+                    raise AgenticClientError(f"Failed to contact backend: {exc}") from exc
+            else:
+                if attempt >= self._retry.max_attempts or not is_retryable_status(
+                    method, response.status_code, self._retry.retry_statuses
+                ):
+                    if not response.is_success:
+                        if stream:
+                            response.read()
+                            response.close()
+                        raise_for_status(response)
+                    return response
+                wait = retry_after(response)
+                response.close()
+            time.sleep(self._retry.delay(attempt, wait))
+            attempt += 1
+
+
+class ChatStream:
+    """Iterator over streamed tokens; ``result`` is set once the stream ends."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+        self.result: Optional[ChatResult] = None
+
+    def __enter__(self) -> "ChatStream":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            for line in self._response.iter_lines():
+                token, result = parse_stream_event(line)
+                if token:
+                    yield token
+                if result is not None:
+                    self.result = result
+        except httpx.HTTPError as exc:
+            raise AgenticClientError(f"Stream interrupted: {exc}") from exc
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._response.close()
+
+
+class ChatSession:
+    """Conversation whose context is kept on the server under ``session_id``."""
+
+    def __init__(self, client: AgenticClient, agent_id: str, session_id: str) -> None:
+        self.client = client
+        self.agent_id = agent_id
+        self.session_id = session_id
+
+    def send(
+        self,
+        message: str,
+        *,
+        context: Optional[Mapping[str, object]] = None,
+        attachments: Sequence[AttachmentHandle] = (),
+        deadline: Optional[float] = None,
+    ) -> ChatResult:
+        return self.client.chat(
+            self.agent_id,
+            message,
+            session_id=self.session_id,
+            context=context,
+            attachments=attachments,
+            deadline=deadline,
+        )
+
+    def stream(
+        self,
+        message: str,
+        *,
+        context: Optional[Mapping[str, object]] = None,
+        attachments: Sequence[AttachmentHandle] = (),
+        deadline: Optional[float] = None,
+    ) -> ChatStream:
+        return self.client.stream_chat(
+            self.agent_id,
+            message,
+            session_id=self.session_id,
+            context=context,
+            attachments=attachments,
+            deadline=deadline,
+        )
+
+    def reset(self) -> None:
+        """Drop the server-side context for this session."""
+
+        self.client.delete_session(self.session_id)
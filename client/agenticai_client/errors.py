@@ -0,0 +1,16 @@
+"""Exceptions raised by the AgenticAI client."""
+
+from __future__ import annotations
+
+
+class AgenticClientError(RuntimeError):
+    """Base error for failures talking to the AgenticAI backend."""
+
+
+class APIError(AgenticClientError):
+    """Raised when the backend answers with an error status or error event."""
+
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(f"{status_code}: {detail}")
+        self.status_code = status_code
+        self.detail = detail
@@ -0,0 +1,65 @@
+"""Value objects exchanged with the AgenticAI backend."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class AttachmentHandle:
+    """Reference to an attachment already uploaded to the backend."""
+
+    id: str
+    name: str
+    content_type: Optional[str]
+    size: int
+
+    def as_reference(self) -> Dict[str, object]:
+        return {"id": self.id, "name": self.name, "content_type": self.content_type}
+
+
+@dataclass
+class ChatResult:
+    """Outcome of a single chat turn."""
+
+    agent_id: str
+    response: str
+    context: Dict[str, object] = field(default_factory=dict)
+    session_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ChatTurn:
+    """Arguments for one turn submitted through the batch helpers."""
+
+    agent_id: str
+    message: str
+    session_id: Optional[str] = None
+    context: Optional[Mapping[str, object]] = None
+    attachments: Sequence[AttachmentHandle] = ()
+    deadline: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient failures."""
+
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 8.0
+    # 504 is left out: the backend uses it for an exceeded request deadline.
+    # POSTs are only retried on 429 and 503, see ``is_retryable_status``.
+    retry_statuses: frozenset = frozenset({429, 502, 503})
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before retry number ``attempt`` (starting at 1).
+
+        A server-provided ``retry_after`` wins, capped at ``max_backoff``.
+        """
+
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        ceiling = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
@@ -0,0 +1,75 @@
+import hashlib
+import json
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+import httpx
+import pytest
+
+Responder = Callable[[httpx.Request], httpx.Response]
+
+
+class FakeBackend:
+    """In-memory stand-in for the AgenticAI API behind ``httpx.MockTransport``.
+
+    ``script[path]`` holds responses (or exceptions) returned before the
+    default behaviour, which lets tests inject transient failures.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+        self.script: Dict[str, list] = defaultdict(list)
+        self.attachments: Dict[str, bytes] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        scripted = self.script[request.url.path]
+        if scripted:
+            outcome = scripted.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        if request.url.path == "/api/attachments":
+            attachment_id = hashlib.sha256(request.content).hexdigest()
+            self.attachments[attachment_id] = request.content
+            return httpx.Response(201, json={"id": attachment_id, "size": len(request.content)})
+        if request.url.path.startswith("/api/sessions/"):
+            return httpx.Response(204)
+        payload = json.loads(request.content)
+        for attachment in payload.get("attachments", []):
+            if attachment["id"] not in self.attachments:
+                return httpx.Response(
+                    404, json={"detail": f"Unknown attachment id '{attachment['id']}'"}
+                )
+        if request.url.path == "/api/chat/stream":
+            return httpx.Response(200, content=ndjson(stream_events(payload)))
+        return httpx.Response(200, json=chat_result(payload))
+
+    def calls(self, path: str) -> List[httpx.Request]:
+        return [request for request in self.requests if request.url.path == path]
+
+
+def chat_result(payload: dict) -> dict:
+    return {
+        "agent_id": payload["agent_id"],
+        "response": f"echo: {payload['message']}",
+        "context": {"seen": payload["message"]} if payload.get("return_context") else {},
+        "session_id": payload.get("session_id"),
+    }
+
+
+def stream_events(payload: dict) -> List[dict]:
+    return [
+        {"type": "token", "content": "echo: "},
+        {"type": "token", "content": payload["message"]},
+        {"type": "done", **chat_result(payload)},
+    ]
+
+
+def ndjson(events: List[dict]) -> bytes:
+    return "".join(json.dumps(event) + "\n" for event in events).encode("utf-8")
+
+
+@pytest.fixture
+def backend() -> FakeBackend:
+    return FakeBackend()
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from agenticai_client import (
+    AgenticClient,
+    AgenticClientError,
+    APIError,
+    AsyncAgenticClient,
+    ChatTurn,
+)
+from agenticai_client._common import parse_stream_event
+
+from .conftest import ndjson
+
+
+def make_client(backend):
+    return AgenticClient(transport=httpx.MockTransport(backend))
+
+
+def test_parse_stream_event():
+    assert parse_stream_event("  \n") == (None, None)
+    assert parse_stream_event('{"type": "token", "content": "Hi"}') == ("Hi", None)
+    assert parse_stream_event('{"type": "ping"}') == (None, None)
+    _, result = parse_stream_event('{"type": "done", "agent_id": "ocr", "response": "Hi"}')
+    assert (result.agent_id, result.response, result.context) == ("ocr", "Hi", {})
+    with pytest.raises(APIError) as excinfo:
+        parse_stream_event('{"type": "error", "status_code": 504, "detail": "late"}')
+    assert (excinfo.value.status_code, excinfo.value.detail) == (504, "late")
+
+
+def test_context_is_only_returned_without_a_session(backend):
+    client = make_client(backend)
+
+    assert client.chat("ocr", "hi").context == {"seen": "hi"}
+    result = client.session("ocr", "s1").send("again")
+
+    assert result.context == {}
+    assert result.session_id == "s1"
+    payloads = [json.loads(request.content) for request in backend.requests]
+    assert [payload["return_context"] for payload in payloads] == [True, False]
+
+
+def test_stream_yields_tokens_and_sets_result(backend):
+    stream = make_client(backend).stream_chat("ocr", "hi")
+
+    assert list(stream) == ["echo: ", "hi"]
+    assert stream.result is not None and stream.result.response == "echo: hi"
+
+
+def test_stream_error_event_raises_api_error(backend):
+    events = [{"type": "token", "content": "par"}, {"type": "error", "status_code": 502}]
+    backend.script["/api/chat/stream"] = [httpx.Response(200, content=ndjson(events))]
+    stream = make_client(backend).stream_chat("ocr", "hi")
+
+    tokens = []
+    with pytest.raises(APIError) as excinfo:
+        for token in stream:
+            tokens.append(token)
+
+    assert tokens == ["par"]
+    assert excinfo.value.status_code == 502
+
+
+def test_interrupted_stream_raises_client_error(backend):
+    def broken_body():
+        yield b'{"type": "token", "content": "par"}\n'
+        raise httpx.ReadError("connection reset")
+
+    backend.script["/api/chat/stream"] = [httpx.Response(200, content=broken_body())]
+
+    with pytest.raises(AgenticClientError, match="Stream interrupted"):
+        list(make_client(backend).stream_chat("ocr", "hi"))
+
+
+def test_error_status_raises_with_detail(backend):
+    backend.script["/api/chat"] = [httpx.Response(404, json={"detail": "Unknown agent_id"})]
+
+    with pytest.raises(APIError) as excinfo:
+        make_client(backend).chat("nope", "hi")
+
+    assert (excinfo.value.status_code, excinfo.value.detail) == (404, "Unknown agent_id")
+
+
+def test_session_reset_deletes_server_state(backend):
+    make_client(backend).session("ocr", "s1").reset()
+
+    (request,) = backend.requests
+    assert (request.method, request.url.path) == ("DELETE", "/api/sessions/s1")
+
+
+def reversed_latency(backend):
+    """Answer later turns faster so completion order differs from input order."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.05 / (1 + int(json.loads(request.content)["message"])))
+        return backend(request)
+
+    return handler
+
+
+def test_chat_many_keeps_input_order(backend):
+    client = AgenticClient(transport=httpx.MockTransport(reversed_latency(backend)))
+
+    results = client.chat_many([ChatTurn("ocr", str(number)) for number in range(4)])
+
+    assert [result.response for result in results] == [f"echo: {n}" for n in range(4)]
+
+
+def test_async_client_matches_sync_client(backend):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05 / (1 + int(json.loads(request.content)["message"])))
+        return backend(request)
+
+    async def scenario():
+        async with AsyncAgenticClient(transport=httpx.MockTransport(handler)) as client:
+            results = await client.chat_many(
+                [ChatTurn("ocr", str(number)) for number in range(4)], max_concurrency=2
+            )
+            stream = await client.session("ocr", "s1").stream("5")
+            tokens = [token async for token in stream]
+            return results, tokens, stream.result
+
+    results, tokens, final = asyncio.run(scenario())
+
+    assert [result.response for result in results] == [f"echo: {n}" for n in range(4)]
+    assert tokens == ["echo: ", "5"]
+    assert final.session_id == "s1"
@@ -0,0 +1,30 @@
+import json
+
+import httpx
+
+from agenticai_client import AgenticClient, ChatTurn
+
+
+def test_read_timeout_is_not_sent_as_a_deadline(backend):
+    client = AgenticClient(timeout=60, transport=httpx.MockTransport(backend))
+
+    client.chat("ocr", "hi")
+    list(client.stream_chat("ocr", "hi"))
+
+    for request in backend.requests:
+        assert "x-request-timeout" not in request.headers
+        assert "timeout" not in json.loads(request.content)
+
+
+def test_explicit_deadline_is_sent_with_the_turn(backend):
+    client = AgenticClient(transport=httpx.MockTransport(backend))
+
+    client.chat("ocr", "hi", deadline=5)
+    list(client.session("ocr").stream("hi", deadline=7.5))
+    client.chat_many([ChatTurn("ocr", "hi", deadline=3)])
+
+    assert [json.loads(request.content)["timeout"] for request in backend.requests] == [
+        5,
+        7.5,
+        3,
+    ]
@@ -0,0 +1,119 @@
+import asyncio
+
+import httpx
+import pytest
+
+from agenticai_client import (
+    AgenticClient,
+    AgenticClientError,
+    APIError,
+    AsyncAgenticClient,
+    RetryPolicy,
+)
+from agenticai_client import client as client_module
+
+NO_WAIT = RetryPolicy(max_attempts=3, backoff_factor=0.0)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(client_module.time, "sleep", recorded.append)
+    return recorded
+
+
+def make_client(backend, retry=NO_WAIT):
+    return AgenticClient(retry=retry, transport=httpx.MockTransport(backend))
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_post_is_retried_when_refused(backend, sleeps, status_code):
+    backend.script["/api/chat"] = [httpx.Response(status_code)]
+
+    assert make_client(backend).chat("ocr", "hi").response == "echo: hi"
+    assert len(backend.calls("/api/chat")) == 2
+
+
+def test_post_is_not_retried_on_bad_gateway(backend, sleeps):
+    # A proxy may answer 502 after the backend already ran the turn.
+    backend.script["/api/chat"] = [httpx.Response(502, json={"detail": "upstream"})]
+
+    with pytest.raises(APIError) as excinfo:
+        make_client(backend).chat("ocr", "hi")
+
+    assert excinfo.value.status_code == 502
+    assert len(backend.calls("/api/chat")) == 1
+
+
+def test_delete_is_retried_on_bad_gateway(backend, sleeps):
+    backend.script["/api/sessions/s1"] = [httpx.Response(502), httpx.Response(502)]
+
+    make_client(backend).delete_session("s1")
+
+    assert len(backend.calls("/api/sessions/s1")) == 3
+
+
+def test_retry_after_header_sets_the_delay(backend, sleeps):
+    backend.script["/api/chat"] = [httpx.Response(429, headers={"Retry-After": "2"})]
+
+    make_client(backend, RetryPolicy()).chat("ocr", "hi")
+
+    assert sleeps == [2.0]
+
+
+def test_backoff_grows_exponentially_with_jitter(backend, sleeps):
+    policy = RetryPolicy(max_attempts=4, backoff_factor=0.5, max_backoff=1.0)
+    backend.script["/api/chat"] = [httpx.Response(503)] * 3
+
+    make_client(backend, policy).chat("ocr", "hi")
+
+    assert len(sleeps) == 3
+    for delay, ceiling in zip(sleeps, [0.5, 1.0, 1.0]):
+        assert 0 <= delay <= ceiling
+
+
+def test_gives_up_after_max_attempts(backend, sleeps):
+    backend.script["/api/chat"] = [httpx.Response(503, json={"detail": "busy"})] * 3
+
+    with pytest.raises(APIError) as excinfo:
+        make_client(backend).chat("ocr", "hi")
+
+    assert excinfo.value.status_code == 503
+    assert len(backend.calls("/api/chat")) == 3
+
+
+def test_post_is_retried_only_if_never_sent(backend, sleeps):
+    backend.script["/api/chat"] = [httpx.ConnectError("refused")]
+    assert make_client(backend).chat("ocr", "hi").response == "echo: hi"
+
+    backend.script["/api/chat"] = [httpx.ReadTimeout("slow")]
+    with pytest.raises(AgenticClientError, match="Failed to contact backend"):
+        make_client(backend).chat("ocr", "hi")
+    assert len(backend.calls("/api/chat")) == 3
+
+
+def test_get_style_requests_retry_any_transport_error(backend, sleeps):
+    backend.script["/api/sessions/s1"] = [httpx.ReadTimeout("slow")]
+
+    make_client(backend).delete_session("s1")
+
+    assert len(backend.calls("/api/sessions/s1")) == 2
+
+
+def test_async_client_applies_the_same_rules(backend, monkeypatch):
+    async def no_sleep(_):
+        return None
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    backend.script["/api/chat"] = [httpx.Response(503), httpx.Response(502)]
+
+    async def scenario():
+        async with AsyncAgenticClient(
+            retry=NO_WAIT, transport=httpx.MockTransport(backend)
+        ) as client:
+            await client.chat("ocr", "hi")
+
+    with pytest.raises(APIError) as excinfo:
+        asyncio.run(scenario())
+    assert excinfo.value.status_code == 502
+    assert len(backend.calls("/api/chat")) == 2
@@ -0,0 +1,63 @@
+import asyncio
+
+import httpx
+import pytest
+
+from agenticai_client import AgenticClient, APIError, AsyncAgenticClient
+from agenticai_client import _common
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(_common.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_identical_content_is_uploaded_once(backend):
+    client = AgenticClient(transport=httpx.MockTransport(backend))
+
+    first = client.upload(b"scan", name="a.png")
+    second = client.upload(b"scan", name="b.png", content_type="image/png")
+
+    assert len(backend.calls("/api/attachments")) == 1
+    assert second.id == first.id
+    assert (second.name, second.content_type) == ("b.png", "image/png")
+
+
+def test_cached_handles_expire(backend, clock):
+    client = AgenticClient(transport=httpx.MockTransport(backend), upload_cache_ttl=60)
+    client.upload(b"scan", name="a.png")
+
+    clock[0] += 61
+    client.upload(b"scan", name="a.png")
+
+    assert len(backend.calls("/api/attachments")) == 2
+
+
+def test_pruned_attachment_is_uploaded_again_after_404(backend):
+    client = AgenticClient(transport=httpx.MockTransport(backend))
+    handle = client.upload(b"scan", name="a.png")
+    backend.attachments.clear()  # The server pruned the file.
+
+    with pytest.raises(APIError) as excinfo:
+        client.chat("ocr", "total?", attachments=[handle])
+    assert excinfo.value.status_code == 404
+
+    handle = client.upload(b"scan", name="a.png")
+    assert client.chat("ocr", "total?", attachments=[handle]).response == "echo: total?"
+    assert len(backend.calls("/api/attachments")) == 2
+
+
+def test_async_client_recovers_from_pruned_attachment(backend):
+    async def scenario():
+        async with AsyncAgenticClient(transport=httpx.MockTransport(backend)) as client:
+            handle = await client.upload(b"scan", name="a.png")
+            backend.attachments.clear()
+            with pytest.raises(APIError):
+                await client.stream_chat("ocr", "total?", attachments=[handle])
+            handle = await client.upload(b"scan", name="a.png")
+            return await client.chat("ocr", "total?", attachments=[handle])
+
+    assert asyncio.run(scenario()).response == "echo: total?"
+    assert len(backend.calls("/api/attachments")) == 2
@@ -2,28 +2,33 @@
 
 from __future__ import annotations
 
-import base64
 import json
+import uuid
 from typing import Dict, List
 
-import requests
 import streamlit as st
+from agenticai_client import AgenticClient, AgenticClientError, AttachmentHandle
 
-BACKEND_URL = st.secrets.get("backend_url", "http://localhost:8000/api/chat")
+# Older deployments configured the full chat endpoint; the client wants the base URL.
+BACKEND_URL = st.secrets.get("backend_url", "http://localhost:8000").removesuffix(
+    "/api/chat"
+)
+
+
+@st.cache_resource
+def get_client() -> AgenticClient:
+    """One pooled client per Streamlit server so connections are reused."""
+
+    return AgenticClient(BACKEND_URL, timeout=60)
 
 
 def _init_session_state() -> None:
     st.session_state.setdefault("conversation", [])
-    st.session_state.setdefault("server_context", {})
+    st.session_state.setdefault("session_id", uuid.uuid4().hex)
 
 
-def encode_file(file) -> Dict[str, str]:
-    content = file.read()
-    return {
-        "name": file.name,
-        "content_type": file.type,
-        "data": base64.b64encode(content).decode("utf-8"),
-    }
+def upload_file(file) -> AttachmentHandle:
+    return get_client().upload(file.getvalue(), name=file.name, content_type=file.type)
 
 
 def render_sidebar() -> Dict[str, object]:
@@ -41,23 +46,39 @@ def render_sidebar() -> Dict[str, object]:
             st.sidebar.warning("Invalid telemetry JSON; ignoring.")
     clear = st.sidebar.button("Clear conversation")
     if clear:
+        try:
+            get_client().delete_session(st.session_state["session_id"])
+        except AgenticClientError:  # pragma: no cover - interactive UI
+            pass
         st.session_state["conversation"] = []
-        st.session_state["server_context"] = {}
+        st.session_state["session_id"] = uuid.uuid4().hex
     return {"agent_id": agent_id, "context": context}
 
 
-def _send_request(payload: Dict[str, object]) -> Dict[str, object] | None:
+def _send_turn(
+    config: Dict[str, object],
+    user_message: str,
+    uploaded_files: List,
+) -> str | None:
+    placeholder = st.empty()
+    text = ""
     try:
-        response = requests.post(BACKEND_URL, json=payload, timeout=60)
-    except requests.RequestException as exc:  # pragma: no cover - interactive UI
-        st.error(f"Failed to contact backend: {exc}")
+        attachments = [upload_file(file) for file in uploaded_files]
+        stream = get_client().stream_chat(
+            str(config["agent_id"]),
+            user_message,
+            session_id=st.session_state["session_id"],
+            context=config.get("context") or None,
+            attachments=attachments,
+        )
+        for token in stream:
+            text += token
+            placeholder.markdown(f"**Agent:** {text}")
+    except AgenticClientError as exc:  # pragma: no cover - interactive UI
+        st.error(f"Request failed: {exc}")
         return None
-
-    if not response.ok:
-        st.error(f"Request failed: {response.status_code} {response.text}")
-        return None
-
-    return response.json()
+    placeholder.empty()
+    return stream.result.response if stream.result else text
 
 
 def render_chat_interface(config: Dict[str, object]) -> None:
@@ -72,37 +93,19 @@ def render_chat_interface(config: Dict[str, object]) -> None:
     send_clicked = st.button("Send")
 
     if send_clicked and user_message:
-        attachments = [encode_file(file) for file in uploaded_files] if uploaded_files else []
-        context = dict(st.session_state.get("server_context", {}))
-        context.update(config.get("context", {}))
-        payload = {
-            "agent_id": config["agent_id"],
-            "message": user_message,
-            "context": context,
-            "attachments": attachments,
-        }
-        data = _send_request(payload)
-        if data:
-            server_context = data.get("context", {})
-            history = server_context.get("conversation_history", [])
-            if isinstance(history, list) and history:
-                st.session_state["conversation"] = history
-            else:
-                st.session_state["conversation"].append(
-                    {
-                        "role": "user",
-                        "message": user_message,
-                        "attachments": [att["name"] for att in attachments],
-                    }
-                )
-                st.session_state["conversation"].append(
-                    {
-                        "role": "agent",
-                        "message": data.get("response", ""),
-                        "context": server_context,
-                    }
-                )
-            st.session_state["server_context"] = server_context
+        uploaded_files = uploaded_files or []
+        reply = _send_turn(config, user_message, uploaded_files)
+        if reply is not None:
+            st.session_state["conversation"].append(
+                {
+                    "role": "user",
+                    "message": user_message,
+                    "attachments": [file.name for file in uploaded_files],
+                }
+            )
+            st.session_state["conversation"].append(
+                {"role": "agent", "message": reply}
+            )
 
     if st.session_state["conversation"]:
         st.markdown("### Conversation history")